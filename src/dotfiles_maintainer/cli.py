@@ -8,6 +8,7 @@ import platform
 import sys
 from collections.abc import Coroutine
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypeVar, Annotated
 
@@ -17,8 +18,9 @@ from rich.table import Table
 
 from dotfiles_maintainer.config import ServerConfig
 from dotfiles_maintainer.core.memory import MemoryManager
+from dotfiles_maintainer.core.types import MemoryResult
 from dotfiles_maintainer.server import mcp  # Import the MCP instance to access tools
-from dotfiles_maintainer.tools import drift
+from dotfiles_maintainer.tools import drift, roadmap, trials, troubleshooting
 
 # --- Setup ---
 
@@ -28,6 +30,7 @@ app = typer.Typer(
     add_completion=False,
 )
 console = Console()
+logger = logging.getLogger(__name__)
 
 # Sub-commands
 memory_app = typer.Typer(name="memory", help="Inspect and manage semantic memory.")
@@ -47,6 +50,15 @@ _loop: asyncio.AbstractEventLoop | None = None
 T = TypeVar("T")
 
 
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, preferring uvloop when it is installed."""
+    try:
+        import uvloop  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
 def get_loop() -> asyncio.AbstractEventLoop:
     """Get or create the global event loop."""
     global _loop
@@ -54,7 +66,7 @@ def get_loop() -> asyncio.AbstractEventLoop:
         try:
             _loop = asyncio.get_running_loop()
         except RuntimeError:
-            _loop = asyncio.new_event_loop()
+            _loop = new_event_loop()
             asyncio.set_event_loop(_loop)
     return _loop
 
@@ -63,6 +75,12 @@ def shutdown_loop():
     """Cleanup the event loop on exit."""
     global _loop
     if _loop and not _loop.is_closed():
+        # Let background drift writes (from any command) reach memory
+        try:
+            _loop.run_until_complete(drift.flush_pending())
+        except Exception:
+            logger.exception("Failed to flush pending drift records before exit")
+
         # Cancel all running tasks
         pending = asyncio.all_tasks(_loop)
         for task in pending:
@@ -99,12 +117,42 @@ def run_async(coro: Coroutine[Any, Any, T]) -> T:
 # --- Helpers ---
 
 
+@lru_cache(maxsize=1)
 def get_memory() -> MemoryManager:
-    """Initialize a MemoryManager with default server configuration."""
+    """Return the process-wide MemoryManager, creating it on first use.
+
+    Building the manager boots the vector store, LLM client and embedder, so
+    it is shared by every command run on the CLI's event loop.
+    """
     config = ServerConfig()
     return MemoryManager(config)
 
 
+async def collect_status(manager: MemoryManager) -> dict[str, list[MemoryResult]]:
+    """Fetch pending roadmap items, active trials and troubleshooting notes.
+
+    The three searches are independent, so they run concurrently and the
+    total wait is that of the slowest one.
+
+    Args:
+        manager: Memory manager to search.
+
+    Returns:
+        Results keyed by section title, in display order.
+
+    """
+    pending, active, fixes = await asyncio.gather(
+        roadmap.query_roadmap(manager, "pending"),
+        trials.list_active_trials(manager, 0),
+        troubleshooting.get_troubleshooting_guide(manager, ""),
+    )
+    return {
+        "Pending Roadmap": pending,
+        "Active Trials": active,
+        "Troubleshooting": fixes,
+    }
+
+
 @app.callback()
 def main(
     verbose: Annotated[
@@ -121,31 +169,34 @@ def main(
 
 @memory_app.command("inspect")
 def memory_inspect(
-    query: Annotated[str, typer.Argument(help="Search query to inspect memory.")],
-    limit: Annotated[int, typer.Option(help="Number of results to return.")] = 5,
+    queries: Annotated[
+        list[str], typer.Argument(help="One or more search queries to inspect memory.")
+    ],
+    limit: Annotated[int, typer.Option(help="Number of results per query.")] = 5,
 ) -> None:
     """Semantic search in the memory store."""
-    console.print(f"[bold blue]Searching memory for:[/bold blue] '{query}'")
     manager = get_memory()
     try:
-        results = run_async(manager.search(query, limit=limit))
-        if not results.results:
-            console.print("[yellow]No matching memories found.[/yellow]")
-            return
-
-        table = Table(title=f"Search Results ({len(results.results)})")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Memory", style="white")
-        table.add_column("Score", style="green")
-
-        for mem in results.results:
-            # Use Pydantic model attributes directly
-            mem_id = mem.id
-            text = mem.memory
-            score = mem.score
-            table.add_row(str(mem_id), str(text), f"{score:.2f}")
-
-        console.print(table)
+        all_results = run_async(manager.search_many(queries, limit=limit))
+        for query, results in zip(queries, all_results):
+            console.print(f"[bold blue]Searching memory for:[/bold blue] '{query}'")
+            if not results.results:
+                console.print("[yellow]No matching memories found.[/yellow]")
+                continue
+
+            table = Table(title=f"Search Results ({len(results.results)})")
+            table.add_column("ID", style="cyan", no_wrap=True)
+            table.add_column("Memory", style="white")
+            table.add_column("Score", style="green")
+
+            for mem in results.results:
+                # Use Pydantic model attributes directly
+                mem_id = mem.id
+                text = mem.memory
+                score = mem.score
+                table.add_row(str(mem_id), str(text), f"{score:.2f}")
+
+            console.print(table)
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
 
@@ -252,9 +303,8 @@ def system_drift() -> None:
     try:
         # We need to manually invoke drift.check_config_drift.
         # Note: server.py passes timeout from config, we should too.
-        config = ServerConfig()
         result = run_async(
-            drift.check_config_drift(manager, timeout=config.vcs_timeout)
+            drift.check_config_drift(manager, timeout=manager.config.vcs_timeout)
         )
 
         console.print(f"[bold]Status:[/bold] {result.status}")
@@ -266,6 +316,31 @@ def system_drift() -> None:
         else:
             console.print("[bold red] Status: Error[/bold red]")
 
+        # Let the background memory write finish before the loop shuts down
+        run_async(drift.flush_pending())
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+
+
+@system_app.command("status")
+def system_status() -> None:
+    """Show pending roadmap items, active trials and known fixes."""
+    manager = get_memory()
+    try:
+        sections = run_async(collect_status(manager))
+        for title, results in sections.items():
+            if not results:
+                console.print(f"[yellow]{title}: nothing recorded.[/yellow]")
+                continue
+
+            table = Table(title=f"{title} ({len(results)})")
+            table.add_column("ID", style="cyan", no_wrap=True)
+            table.add_column("Memory", style="white")
+            for mem in results:
+                table.add_row(mem.id, mem.memory)
+            console.print(table)
+
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
 
@@ -278,10 +353,9 @@ def system_health() -> None:
     from dotfiles_maintainer.tools import health
 
     manager = get_memory()
-    config = ServerConfig()
 
     try:
-        result = run_async(health.health_check(config, manager))
+        result = run_async(health.health_check(manager.config, manager))
 
         status_color = "green" if result.status == "healthy" else "red"
         console.print(
@@ -423,11 +497,10 @@ def tools_run(
         console.print(f"Args: {kwargs}")
 
     # 3. Create Mock Context
-    config = ServerConfig()
-    memory = MemoryManager(config)
+    memory = get_memory()
     mock_ctx = MockContext(
         request_context=MockRequest(
-            lifespan_context=MockLifespan(config=config, memory=memory)
+            lifespan_context=MockLifespan(config=memory.config, memory=memory)
         )
     )
 
@@ -2,24 +2,37 @@
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import ClassVar, Literal
-
-from langchain_huggingface import HuggingFaceEmbeddings
-from mem0.configs.base import MemoryConfig
-from mem0.embeddings.configs import EmbedderConfig
-from mem0.llms.configs import LlmConfig
-from mem0.vector_stores.configs import VectorStoreConfig
-from pydantic import Field, computed_field, field_validator, model_validator
+from typing import TYPE_CHECKING, ClassVar, Literal
+
+from pydantic import (
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from .prompts.memory import DOTFILES_CUSTOM_FACT_EXTRACTION_PROMPT
 
+if TYPE_CHECKING:
+    # mem0 imports the Qdrant client and LLM SDKs (~1s); only load it when a
+    # memory client is actually built.
+    from mem0.configs.base import MemoryConfig
+    from mem0.llms.configs import LlmConfig
+
 logger = logging.getLogger(__name__)
 
 LLMProvider = Literal["openai", "anthropic", "gemini", "ollama"]
 
 
+@lru_cache(maxsize=64)
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and parents) once per process."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
 class ServerConfig(BaseSettings):
     """Validated server configuration.
 
@@ -44,6 +57,14 @@ class ServerConfig(BaseSettings):
         validation_alias="DOTFILES_MEMORY_PATH",
         description="Qdrant database path",
     )
+    # The embedded store at memory_db_path scans every vector on search; a
+    # Qdrant server answers from an HNSW index instead.
+    qdrant_url: str | None = Field(
+        default=None,
+        validation_alias="QDRANT_URL",
+        description="Qdrant server URL, used instead of the embedded store when set",
+    )
+    qdrant_api_key: str | None = Field(default=None, validation_alias="QDRANT_API_KEY")
 
     # Internal LLM settings
     gemini_api_key: str | None = Field(default=None, validation_alias="GEMINI_API_KEY")
@@ -95,13 +116,14 @@ class ServerConfig(BaseSettings):
 
         return self
 
-    @computed_field
     @property
-    def llm_config(self) -> LlmConfig:
+    def llm_config(self) -> "LlmConfig":
         """Constructs the LLm configuration based on the provider.
 
         Requires appropriate API keys to be set in the environment.
         """
+        from mem0.llms.configs import LlmConfig
+
         # OLLAMA does not need an API key usually
         if self.llm_provider == "ollama":
             return LlmConfig(
@@ -125,8 +147,8 @@ class ServerConfig(BaseSettings):
     @computed_field
     @property
     def embedding_model(self) -> str:
-        """Return the name of the sentence-transformer model."""
-        return "all-MiniLM-L6-v2"
+        """Return the name of the sentence-transformer model (run via FastEmbed)."""
+        return "sentence-transformers/all-MiniLM-L6-v2"
 
     @computed_field
     @property
@@ -134,12 +156,6 @@ class ServerConfig(BaseSettings):
         """Return the embedding dimension count (e.g., 384)."""
         return 384
 
-    @computed_field
-    @property
-    def embedder_model(self) -> HuggingFaceEmbeddings:
-        """Initialize the HuggingFace embedding engine."""
-        return HuggingFaceEmbeddings(model_name=self.embedding_model)
-
     # Memory Config
 
     custom_fact_extraction_prompt: str = Field(
@@ -147,26 +163,37 @@ class ServerConfig(BaseSettings):
         description="Guidance Prompt for internal LLM on how to extract facts.",
     )
 
-    @computed_field
     @property
-    def memory_config(self) -> MemoryConfig:
+    def memory_config(self) -> "MemoryConfig":
         """Construct the full mem0 configuration object."""
+        from mem0.configs.base import MemoryConfig
+        from mem0.embeddings.configs import EmbedderConfig
+        from mem0.vector_stores.configs import VectorStoreConfig
+
+        vector_store_config: dict[str, str | int | bool] = {
+            "path": str(self.memory_db_path),
+            "on_disk": True,
+            "embedding_model_dims": self.embedding_dims,
+        }
+        if self.qdrant_url:
+            vector_store_config["url"] = self.qdrant_url
+        if self.qdrant_api_key:
+            vector_store_config["api_key"] = self.qdrant_api_key
+
         return MemoryConfig(
             custom_fact_extraction_prompt=self.custom_fact_extraction_prompt,
             version="v1.1",  # This controls output format globally
             vector_store=VectorStoreConfig(
                 provider="qdrant",
-                config={
-                    "path": str(self.memory_db_path),
-                    "on_disk": True,
-                    "embedding_model_dims": self.embedding_dims,
-                },
+                config=vector_store_config,
             ),
             llm=self.llm_config,
+            # FastEmbed runs the ONNX export of the model, no PyTorch required
             embedder=EmbedderConfig(
-                provider="langchain",
+                provider="fastembed",
                 config={
-                    "model": self.embedder_model,
+                    "model": self.embedding_model,
+                    "embedding_dims": self.embedding_dims,
                 },
             ),
         )
@@ -181,6 +208,23 @@ class ServerConfig(BaseSettings):
     # Features
     enable_backup: bool = Field(default=True, description="Backup toggle")
     enable_secrets_scan: bool = Field(default=True, description="Secrets Scan Toggle")
+    enable_quantization: bool = Field(
+        default=True,
+        description="Int8 scalar quantization and on-disk HNSW/payload for the "
+        "Qdrant collection (ignored by the embedded local store)",
+    )
+    hnsw_m: int = Field(
+        default=16,
+        ge=4,
+        le=128,
+        description="HNSW graph degree; higher improves recall at the cost of RAM",
+    )
+    hnsw_ef_construct: int = Field(
+        default=128,
+        ge=4,
+        le=1024,
+        description="HNSW build-time candidate list size; higher improves recall",
+    )
 
     vcs_timeout: int = Field(
         default=10,
@@ -195,5 +239,5 @@ class ServerConfig(BaseSettings):
     def expand_path(cls, v: str | Path) -> Path:
         """Expand ~ and ensure parent directory exists."""
         path = Path(v).expanduser().resolve()
-        path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(str(path.parent))
         return path
@@ -0,0 +1,120 @@
+"""In-process cache for semantic search results."""
+
+import re
+import time
+from collections import OrderedDict
+
+from .types import MetadataValue, SearchResult
+
+# Distinct searches kept per cache
+DEFAULT_MAX_SIZE = 128
+# Seconds before a cached result is considered stale. Writes made through the
+# owning MemoryManager invalidate immediately; the TTL bounds staleness from
+# writes made by other processes sharing the same store.
+DEFAULT_TTL = 300.0
+
+# (normalized query, limit, user_id, sorted metadata filters)
+SearchKey = tuple[str, int, str, tuple[tuple[str, MetadataValue], ...]]
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for use as a cache key.
+
+    The embedding model (all-MiniLM-L6-v2) is uncased and ignores extra
+    whitespace, so queries differing only in case or spacing embed to the
+    same vector and can share a cache entry.
+
+    Args:
+        query: Raw search query.
+
+    Returns:
+        Lowercased query with runs of whitespace collapsed to one space.
+
+    Example:
+        >>> normalize_query("  Roadmap   PENDING ")
+        "roadmap pending"
+
+    """
+    return _WHITESPACE_RE.sub(" ", query).strip().lower()
+
+
+def make_search_key(
+    query: str, limit: int, user_id: str, filters: dict[str, MetadataValue] | None
+) -> SearchKey:
+    """Build the cache key for a search.
+
+    Args:
+        query: Raw search query.
+        limit: Maximum number of results requested.
+        user_id: Memory partition being searched.
+        filters: Optional metadata equality filters.
+
+    Returns:
+        Hashable key; filter order does not matter.
+
+    """
+    return (
+        normalize_query(query),
+        limit,
+        user_id,
+        tuple(sorted(filters.items())) if filters else (),
+    )
+
+
+class SearchCache:
+    """LRU cache of search results bounded by size and age.
+
+    A version counter is bumped on every invalidation so a search that was
+    running while the store changed can be kept out of the cache.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL):
+        """Initialize an empty cache."""
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self.version: int = 0
+        self._entries: OrderedDict[SearchKey, tuple[float, SearchResult]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached entries, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: SearchKey) -> SearchResult | None:
+        """Return the cached result for `key`, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, result = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: SearchKey, result: SearchResult, version: int) -> None:
+        """Store a result unless the cache was invalidated since `version`.
+
+        Args:
+            key: Cache key from the search arguments.
+            result: Search result to cache.
+            version: Value of `self.version` read before the search started.
+
+        """
+        if version != self.version:
+            return
+
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every cached result, e.g. after the store was written to."""
+        self.version += 1
+        self._entries.clear()
@@ -0,0 +1,77 @@
+"""Memory backend errors and the error boundary shared by the MCP tools."""
+
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import ParamSpec, TypeVar, overload
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class MemoryBackendError(Exception):
+    """Raised when mem0 or the vector store fails to complete an operation."""
+
+
+class MemorySearchError(MemoryBackendError):
+    """Raised when memory search fails."""
+
+
+def _return_message(err_msg: str) -> str:
+    """Default fallback: the tool returns the error message itself."""
+    return err_msg
+
+
+@overload
+def tool_error_boundary(
+    message: str,
+) -> Callable[[Callable[P, Awaitable[str]]], Callable[P, Awaitable[str]]]: ...
+
+
+@overload
+def tool_error_boundary(
+    message: str, fallback: Callable[[str], R]
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]: ...
+
+
+def tool_error_boundary(
+    message: str, fallback: Callable[[str], R] = _return_message
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Turn memory backend failures of a tool into a logged sentinel value.
+
+    Only MemoryBackendError is caught; anything else is a bug and propagates.
+
+    Args:
+        message: Error prefix, formatted with the tool's arguments
+            (e.g. "Failed to set Trial for {name}").
+        fallback: Builds the return value from the error message. Defaults to
+            returning the message itself, for tools that return a string.
+
+    Returns:
+        Decorator for an async tool function.
+
+    Example:
+        >>> @tool_error_boundary("Failed to retrieve Trials", lambda _: [])
+        ... async def list_active_trials(memory, min_days_active): ...
+
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(func)
+        logger = logging.getLogger(func.__module__)
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                return await func(*args, **kwargs)
+            except MemoryBackendError as e:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                err_msg = f"{message.format(**bound.arguments)}: {e}"
+                logger.error(err_msg)
+                return fallback(err_msg)
+
+        return wrapper
+
+    return decorator
@@ -1,28 +1,34 @@
 """Memory management with centralized error handling."""
 
+import hashlib
 import logging
 import shutil
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
 
-from mem0 import AsyncMemory
 from pydantic import ValidationError
 
 from ..config import ServerConfig
+from ..utils.concurrency import gather_bounded
 from ..utils.secrets import redact_secrets
+from .cache import SearchCache, make_search_key
+from .errors import MemoryBackendError, MemorySearchError
 from .types import (
     Mem0AddResponse,
     Mem0DeleteResponse,
     Mem0GetAllResponse,
     Mem0UpdateResponse,
+    MetadataValue,
     SearchResult,
 )
 
-logger = logging.getLogger(__name__)
-
+if TYPE_CHECKING:
+    from mem0 import AsyncMemory
 
-class MemorySearchError(Exception):
-    """Raised when memory search fails."""
+logger = logging.getLogger(__name__)
 
-    pass
+# Mem0UpdateResponse.message when update() skipped an identical write
+UNCHANGED_MESSAGE = "Memory unchanged"
 
 
 class MemoryManager:
@@ -36,11 +42,68 @@ class MemoryManager:
         self.config: ServerConfig = config
         self.user_id: str = config.user_id
 
-        # Initialize the AsyncMemory client
-        self.client: AsyncMemory = AsyncMemory(config=config.memory_config)
+        # Initialize the AsyncMemory client. mem0 is imported here rather than
+        # at module level so CLI commands that never touch memory start fast.
+        from mem0 import AsyncMemory as _AsyncMemory
+
+        self.client: AsyncMemory = _AsyncMemory(config=config.memory_config)
+
+        # Search results, dropped whenever the store is written to
+        self.search_cache: SearchCache = SearchCache()
+
+        if config.enable_quantization:
+            self._tune_collection()
+
+    def _tune_collection(self) -> None:
+        """Enable int8 quantization and on-disk storage for the memory collection.
+
+        mem0's Qdrant config does not forward collection options, so they are
+        applied directly on the underlying client once the collection exists.
+        Quantized vectors stay in RAM (4x smaller than float32) while the
+        originals, the HNSW graph and payloads live on disk. Failures are
+        logged and ignored: the collection keeps working unquantized.
+
+        Skipped for the embedded store, which has no index or quantization
+        and ignores collection updates; only a Qdrant server (QDRANT_URL)
+        is tuned.
+        """
+        vector_store = self.client.vector_store
+        if vector_store.is_local:
+            logger.debug("Embedded Qdrant store, skipping collection tuning")
+            return
+
+        try:
+            from qdrant_client import models
+
+            vector_store.client.update_collection(
+                collection_name=vector_store.collection_name,
+                quantization_config=models.ScalarQuantization(
+                    scalar=models.ScalarQuantizationConfig(
+                        type=models.ScalarType.INT8,
+                        quantile=0.99,
+                        always_ram=True,
+                    )
+                ),
+                hnsw_config=models.HnswConfigDiff(
+                    m=self.config.hnsw_m,
+                    ef_construct=self.config.hnsw_ef_construct,
+                    on_disk=True,
+                ),
+                collection_params=models.CollectionParamsDiff(on_disk_payload=True),
+            )
+        except Exception as e:
+            logger.warning(f"Could not enable vector quantization: {e}")
+
+    def invalidate_search_cache(self) -> None:
+        """Forget cached search results.
+
+        Called automatically after every write through this manager. Call it
+        directly when the store may have been changed by another process.
+        """
+        self.search_cache.invalidate()
 
     async def add_with_redaction(
-        self, text: str, metadata: dict[str, str | bool] | None = None
+        self, text: str, metadata: dict[str, MetadataValue] | None = None
     ) -> Mem0AddResponse:
         """Add memory with automatic secret redaction.
 
@@ -48,11 +111,47 @@ class MemoryManager:
             Mem0AddResponse with results list containing ADD/UPDATE/DELETE events.
 
         Raises:
-            ValidationError: if mem0 returns unexpected structure.
+            MemoryBackendError: If mem0 fails to store the memory.
+        """
+        return await self._add(redact_secrets(text) or "", metadata)
+
+    async def add_with_redaction_segments(
+        self,
+        segments: dict[str, str],
+        metadata: dict[str, MetadataValue] | None = None,
+    ) -> Mem0AddResponse:
+        """Add a memory built from labeled fields, redacting each field once.
+
+        Each value is redacted on its own and the result is rendered as one
+        "Label: value" line per field, so the joined text is never scanned
+        again. Labels are trusted constants and are not redacted.
+
+        Args:
+            segments: Ordered mapping of field label to field value.
+            metadata: Optional metadata stored alongside the memory.
+
+        Returns:
+            Mem0AddResponse with results list containing ADD/UPDATE/DELETE events.
+
+        Example:
+            >>> await memory.add_with_redaction_segments(
+            ...     {"Troubleshooting": "E492", "Fix": "remap <leader>"},
+            ...     metadata={"type": "troubleshoot"},
+            ... )
+
         """
+        text = "\n".join(
+            f"{label}: {redact_secrets(value)}" for label, value in segments.items()
+        )
+        return await self._add(text, metadata)
+
+    async def _add(
+        self, text: str, metadata: dict[str, MetadataValue] | None
+    ) -> Mem0AddResponse:
+        """Store already-redacted text in mem0."""
         try:
             result = await self.client.add(
-                messages=redact_secrets(text),
+                messages=text,
                 user_id=self.user_id,
                 metadata=metadata,
             )
@@ -64,14 +163,57 @@ class MemoryManager:
             return Mem0AddResponse(results=[])
         except Exception as e:
             logger.error(f"Failed to add memory: {e}")
-            raise
+            raise MemoryBackendError(f"Failed to add memory: {e}") from e
+        finally:
+            self.invalidate_search_cache()
+
+    async def add_many(
+        self, items: Iterable[tuple[str, dict[str, MetadataValue] | None]]
+    ) -> list[Mem0AddResponse]:
+        """Add several independent memories with automatic secret redaction.
 
-    async def search(self, query: str, limit: int = 10) -> SearchResult:
+        mem0 has no batch insert (a list of messages is treated as a single
+        conversation), so each record is added separately with a bounded
+        number of requests in flight.
+
+        Args:
+            items: (text, metadata) pairs, one per memory record.
+
+        Returns:
+            One Mem0AddResponse per item, in input order.
+
+        Raises:
+            MemoryBackendError: The first error raised while adding any record.
+
+        Example:
+            >>> responses = await memory.add_many(
+            ...     [("zsh uses starship", {"type": "baseline"})]
+            ... )
+
+        """
+        return await gather_bounded(
+            self.add_with_redaction(text, metadata) for text, metadata in items
+        )
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        filters: dict[str, MetadataValue] | None = None,
+        use_cache: bool = True,
+    ) -> SearchResult:
         """Perform a semantic search in the vector store with error handling.
 
+        Repeated (query, limit) searches are served from an in-process cache
+        until the next write through this manager or the cache TTL expires.
+        Queries differing only in case or whitespace share an entry.
+
         Args:
             query (str): The semantic search query string.
             limit (int): Maximum number of results to return (default: 10).
+            filters (dict | None): Metadata equality filters applied by the
+                vector store before ranking (e.g. {"type": "trial"}).
+            use_cache (bool): Set to False to always hit the vector store.
 
         Returns:
             SearchResult containing matching memories ordered by relevance.
@@ -80,12 +222,25 @@ class MemoryManager:
             MemorySearchError: If the search operation fails.
 
         """
+        key = make_search_key(query, limit, self.user_id, filters)
+        if use_cache and (cached := self.search_cache.get(key)) is not None:
+            return cached
+
+        version = self.search_cache.version
         try:
-            result = await self.client.search(query, user_id=self.user_id, limit=limit)
+            result = await self.client.search(
+                query, user_id=self.user_id, limit=limit, filters=filters
+            )
             if not result:
                 return SearchResult(results=[], relations=None)
 
-            return SearchResult.model_validate(result)
+            search_result = SearchResult.model_validate(result)
+
+            # Skipped by the cache if a write happened while the search ran
+            if use_cache:
+                self.search_cache.put(key, search_result, version)
+
+            return search_result
 
         except ValidationError as e:
             logger.error(f"Invalid search result structure: {e}")
@@ -94,24 +249,84 @@ class MemoryManager:
             logger.error(f"Memory search failed: {e}")
             raise MemorySearchError(f"Failed to search: {e}") from e
 
+    async def search_many(
+        self, queries: Sequence[str], limit: int = 10
+    ) -> list[SearchResult]:
+        """Run several semantic searches concurrently.
+
+        mem0 embeds one query per search call, so the searches are issued in
+        parallel (bounded) rather than batched; each one still goes through
+        the search cache.
+
+        Args:
+            queries: Search query strings.
+            limit: Maximum number of results per query (default: 10).
+
+        Returns:
+            One SearchResult per query, in input order.
+
+        Raises:
+            MemorySearchError: If any of the searches fails.
+
+        Example:
+            >>> pending, trials = await memory.search_many(
+            ...     ["roadmap pending", "active plugin trials"]
+            ... )
+
+        """
+        return await gather_bounded(
+            self.search(query, limit=limit) for query in queries
+        )
+
     async def update(self, memory_id: str, text: str) -> Mem0UpdateResponse:
         """Update an existing memory entry.
 
+        If the stored memory already has the same (redacted) content, the
+        write is skipped: mem0 would otherwise re-embed the text and rewrite
+        the vector for no change.
+
         Returns:
             Mem0UpdateResponse with success message.
+
+        Raises:
+            MemoryBackendError: If mem0 fails or returns an unexpected structure.
         """
-        try:
-            result = await self.client.update(
-                data=redact_secrets(text),
-                memory_id=memory_id,
+        data = redact_secrets(text) or ""
+        if await self._is_unchanged(memory_id, data):
+            logger.debug(f"Memory {memory_id} unchanged, skipping update")
+            return Mem0UpdateResponse(
+                id=memory_id, text=data, message=UNCHANGED_MESSAGE
             )
+
+        try:
+            result = await self.client.update(data=data, memory_id=memory_id)
             return Mem0UpdateResponse.model_validate(result)
         except ValidationError as e:
             logger.error(f"Invalid update response: {e}")
-            raise
+            raise MemoryBackendError(f"Invalid update response: {e}") from e
         except Exception as e:
             logger.error(f"Memory update failed: {e}")
-            raise
+            raise MemoryBackendError(f"Failed to update memory: {e}") from e
+        finally:
+            self.invalidate_search_cache()
+
+    async def _is_unchanged(self, memory_id: str, data: str) -> bool:
+        """Return whether memory `memory_id` already stores exactly `data`.
+
+        Compares against the MD5 content hash mem0 keeps in every payload,
+        which costs a point lookup and no embedding. Lookup failures return
+        False so the update goes ahead and reports the real error.
+        """
+        try:
+            existing = await self.client.get(memory_id)
+        except Exception as e:
+            logger.debug(f"Could not read memory {memory_id} before update: {e}")
+            return False
+
+        if not isinstance(existing, dict) or not existing.get("hash"):
+            return False
+        content_hash = hashlib.md5(data.encode(), usedforsecurity=False).hexdigest()
+        return existing["hash"] == content_hash
 
     async def get_all(self, limit: int = 100) -> Mem0GetAllResponse:
         """Retrieve all memories from the store.
@@ -142,6 +357,8 @@ class MemoryManager:
         except Exception as e:
             logger.error(f"Failed to reset memory: {e}")
             raise
+        finally:
+            self.invalidate_search_cache()
 
     async def reset(self) -> None:
         """Delete all memories for all users"""
@@ -158,3 +375,5 @@ class MemoryManager:
         except Exception as e:
             logger.error(f"Failed to reset memory: {e}")
             raise
+        finally:
+            self.invalidate_search_cache()
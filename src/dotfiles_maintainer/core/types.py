@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field, JsonValue
 
+# Scalar types mem0 can store in metadata and match in search filters
+MetadataValue = str | int | bool
+
 
 class MemoryResult(BaseModel):
     """A single search result from the memory vector store.
@@ -23,7 +26,9 @@ class MemoryResult(BaseModel):
     id: str
     memory: str
     score: float
-    metadata: dict[str, JsonValue] | None = None
+    # Payloads come back from the vector store already JSON-decoded, so the
+    # recursive JsonValue check would only add validation cost to every search.
+    metadata: dict[str, Any] | None = None
     created_at: str | None = None
     updated_at: str | None = None
 
@@ -38,7 +43,7 @@ class SearchResult(BaseModel):
     """
 
     results: list[MemoryResult] = Field(default_factory=list)
-    relations: list[JsonValue] | None = None
+    relations: list[Any] | None = None
 
 
 class SearchResultWithGraph(BaseModel):
@@ -78,7 +83,7 @@ class Mem0GetAll(BaseModel):
 
     id: str
     memory: str
-    metadata: dict[str, JsonValue] | None = None
+    metadata: dict[str, Any] | None = None
     created_at: str | None = None
     updated_at: str | None = None
     owner: str | None = None
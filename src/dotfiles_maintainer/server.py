@@ -56,6 +56,7 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
         yield AppContext(config=config, memory=memory)
     finally:
         logger.info("Shutting down server and cleaning up resources...")
+        await drift.flush_pending()
 
 
 # Create MCP server with lifespan
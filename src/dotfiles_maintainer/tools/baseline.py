@@ -6,10 +6,33 @@ This module establishes the ground truth for a user's system environment.
 import logging
 
 from ..core.memory import MemoryManager
-from ..core.types import AppConfig, SystemMetadata
+from ..core.types import AppConfig, MetadataValue, SystemMetadata
 
 logger = logging.getLogger(__name__)
 
+# Stored records: one for the machine, one per application config
+_SYSTEM_TEMPLATE = """User System ->
+Dotfile Manager: {manager}
+System Metadata: {system}"""
+
+_APP_CONFIG_TEMPLATE = """User System ->
+Dotfile Manager: {manager}
+App Config: {config}"""
+
+_DUPLICATE_TEMPLATE = """⚠️ System Baseline not initialized (duplicate detected)
+
+Dotfile Manager: {manager}
+Configs: {configs}
+System Metadata: {system}
+Note: A similar system baseline was already recorded."""
+
+_INITIALIZED_TEMPLATE = """✓ System Baseline Initialized
+Memory ID: {id}
+Event: {event}
+Dotfile Manager: {manager}
+Configs: {configs}
+System Metadata: {system}"""
+
 
 async def initialize_system_baseline(
     memory: MemoryManager,
@@ -26,8 +49,8 @@ async def initialize_system_baseline(
     Workflow:
     1. Search memory for any existing initialization (Agent should do this).
     2. If not found, call this tool to start baseline initialization.
-    3. The tool formats the metadata and config map into a semantic report.
-    4. It stores this report in the persistent semantic memory.
+    3. The tool formats the metadata and each app config as separate records.
+    4. It stores the records in the persistent semantic memory concurrently.
 
     Args:
         memory_manager: The core memory manager instance.
@@ -47,7 +70,8 @@ async def initialize_system_baseline(
             returning an error string to the agent.
 
     Side Effects:
-        - Persistent Memory: Adds a new memory entry with metadata `type: baseline`.
+        - Persistent Memory: Adds one entry for the system metadata plus one
+          per app config, all with metadata `type: baseline`.
         - Logging: Logs the initialization event to the system logger.
 
     Example:
@@ -57,47 +81,58 @@ async def initialize_system_baseline(
 
     """
     try:
-        baseline_text = f"""User System ->
-        Dotfile Manager: {manager_name}
-        Configs: {config_map}
-        System Metadata: {system_metadata}
-        """.strip()
-
-        response = await memory.add_with_redaction(
-            baseline_text,
-            metadata={
+        # Each config is serialized once, for its own record and the report
+        config_jsons = [
+            config.model_dump_json(exclude_none=True) for config in config_map
+        ]
+        report = {
+            "manager": manager_name,
+            "configs": f"[{','.join(config_jsons)}]",
+            "system": system_metadata.model_dump_json(exclude_none=True),
+        }
+
+        system_record: tuple[str, dict[str, MetadataValue]] = (
+            _SYSTEM_TEMPLATE.format(manager=manager_name, system=report["system"]),
+            {
                 "type": "baseline",
                 "dotfile_manager": manager_name,
                 "configs": ", ".join([config.app_name for config in config_map]),
                 "system": system_metadata.os_version,
             },
         )
-
-        if not response.results:
-            duplicate_detected = f"""⚠️ System Baseline not initialized (duplicate detected)
-
-            Dotfile Manager: {manager_name}
-            Configs: {config_map}
-            System Metadata: {system_metadata}
-            Note: A similar system baseline was already recorded."""
+        config_records: list[tuple[str, dict[str, MetadataValue]]] = [
+            (
+                _APP_CONFIG_TEMPLATE.format(manager=manager_name, config=config_json),
+                {
+                    "type": "baseline",
+                    "dotfile_manager": manager_name,
+                    "app": config.app_name,
+                    "system": system_metadata.os_version,
+                },
+            )
+            for config, config_json in zip(config_map, config_jsons, strict=True)
+        ]
+
+        responses = await memory.add_many([system_record, *config_records])
+        events = [event for response in responses for event in response.results]
+
+        if not events:
+            duplicate_detected = _DUPLICATE_TEMPLATE.format(**report)
 
             logger.warning("System Baseline duplicate detected. No new memory added.")
             logger.debug(duplicate_detected)
             return duplicate_detected
 
         # Primary event
-        event = response.results[0]
+        event = events[0]
 
-        memory_log = f"""✓ System Baseline Initialized
-        Memory ID: {event.id}
-        Event: {event.event}
-        Dotfile Manager: {manager_name}
-        Configs: {config_map}
-        System Metadata: {system_metadata}
-
-        {f"Note: {len(response.results)} memories affected" if len(response.results) > 1 else ""}""".strip()
+        memory_log = _INITIALIZED_TEMPLATE.format(
+            id=event.id, event=event.event, **report
+        )
+        if len(events) > 1:
+            memory_log += f"\n\nNote: {len(events)} memories affected"
 
-        logger.info(f"System Baseline Initialized (ID: {event.id})")
+        logger.info("System Baseline Initialized (ID: %s)", event.id)
         logger.debug(memory_log)
         return memory_log
 
@@ -12,6 +12,32 @@ from ..core.types import AppChange
 
 logger = logging.getLogger(__name__)
 
+_CHANGE_TEMPLATE = """Configuration Change: {app_name}
+Type: {change_type}
+Rationale: {rationale}
+Improvement: {improvement_metric}
+Description: {description}"""
+
+# Appended only when the change is tied to a commit
+_VCS_COMMIT_TEMPLATE = "\nVCS Commit: {vcs_commit_id}"
+
+_TIMESTAMP_TEMPLATE = "\nTimestamp: {timestamp}"
+
+_DUPLICATE_TEMPLATE = """⚠️ Change not logged (duplicate detected)
+
+App: {app_name}
+Type: {change_type}
+Note: A similar change was already recorded."""
+
+_LOGGED_TEMPLATE = """✓ Change logged to memory
+
+Memory ID: {id}
+Event: {event}
+App: {app_name}
+Type: {change_type}
+Impact: {improvement_metric}
+Rationale: {rationale}"""
+
 
 async def commit_contextual_change(
     memory: MemoryManager,
@@ -57,15 +83,18 @@ async def commit_contextual_change(
 
     """
     try:
-        change_text = f"""
-        Configuration Change: {data.app_name}
-        Type: {data.change_type}
-        Rationale: {data.rationale}
-        Improvement: {data.improvement_metric}
-        Description: {data.description}
-        VCS Commit: {data.vcs_commit_id}
-        Timestamp: {datetime.now(timezone.utc).isoformat()}
-        """.strip()
+        change_text = _CHANGE_TEMPLATE.format(
+            app_name=data.app_name,
+            change_type=data.change_type,
+            rationale=data.rationale,
+            improvement_metric=data.improvement_metric,
+            description=data.description,
+        )
+        if data.vcs_commit_id:
+            change_text += _VCS_COMMIT_TEMPLATE.format(vcs_commit_id=data.vcs_commit_id)
+        change_text += _TIMESTAMP_TEMPLATE.format(
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
 
         response = await memory.add_with_redaction(
             change_text,
@@ -78,30 +107,35 @@ async def commit_contextual_change(
         )
 
         if not response.results:
-            duplicate_detected = f"""⚠️ Change not logged (duplicate detected)
-
-            App: {data.app_name}
-            Type: {data.change_type}
-            Note: A similar change was already recorded."""
-            logger.warning(f"Change for {data.app_name} duplicate detected. No new memory added.")
+            duplicate_detected = _DUPLICATE_TEMPLATE.format(
+                app_name=data.app_name, change_type=data.change_type
+            )
+            logger.warning(
+                "Change for %s duplicate detected. No new memory added.", data.app_name
+            )
             logger.debug(duplicate_detected)
             return duplicate_detected
 
         # Primary event
         event = response.results[0]
 
-        memory_log = f"""✓ Change logged to memory
-
-        Memory ID: {event.id}
-        Event: {event.event}
-        App: {data.app_name}
-        Type: {data.change_type}
-        Impact: {data.improvement_metric}
-        Rationale: {data.rationale[:100]}{"..." if len(data.rationale) > 100 else ""}
-
-        {f"Note: {len(response.results)} memories affected" if len(response.results) > 1 else ""}""".strip()
+        rationale = data.rationale[:100]
+        if len(data.rationale) > 100:
+            rationale += "..."
+        memory_log = _LOGGED_TEMPLATE.format(
+            id=event.id,
+            event=event.event,
+            app_name=data.app_name,
+            change_type=data.change_type,
+            improvement_metric=data.improvement_metric,
+            rationale=rationale,
+        )
+        if len(response.results) > 1:
+            memory_log += f"\n\nNote: {len(response.results)} memories affected"
 
-        logger.info(f"Change logged to memory (ID: {event.id}, App: {data.app_name})")
+        logger.info(
+            "Change logged to memory (ID: %s, App: %s)", event.id, data.app_name
+        )
         logger.debug(memory_log)
         return memory_log
 
@@ -4,14 +4,62 @@ This module provides tools to verify if the local filesystem configuration
 matches the state recorded in version control.
 """
 
+import asyncio
 import logging
+import re
 
 from ..core.memory import MemoryManager
-from ..core.types import DriftResult
+from ..core.types import DriftResult, Mem0AddResponse
 from ..utils.vcs import get_vcs_command
 
 logger = logging.getLogger(__name__)
 
+# File-status lines of `git status --short` ("M  path", "?? path") and
+# `jj st` ("M path"). Anything else, such as the "Working copy changes:" and
+# "Parent commit" headers of jj, is not a modified file.
+_STATUS_LINE_RE = {
+    "git": re.compile(r"^[MTADRCU?!]{1,2} +\S"),
+    "jj": re.compile(r"^[MADRC?] +\S"),
+}
+
+# Drift memory writes still in flight. Holding the tasks here keeps them from
+# being garbage collected before they finish.
+_pending: set[asyncio.Task[list[Mem0AddResponse]]] = set()
+
+
+def _on_drift_recorded(task: asyncio.Task[list[Mem0AddResponse]]) -> None:
+    """Log the outcome of a background drift write."""
+    _pending.discard(task)
+    if task.cancelled():
+        logger.warning("Recording drift to memory was cancelled")
+        return
+    if exc := task.exception():
+        logger.error("Failed to record drift in memory: %s", exc)
+        return
+
+    events = [event for response in task.result() for event in response.results]
+    if events:
+        logger.info(
+            "Drift saved to memory (ID: %s, Events: %d)", events[0].id, len(events)
+        )
+    else:
+        logger.info("Drift already recorded in memory, no new memory added")
+
+
+async def flush_pending() -> None:
+    """Wait for background drift writes started by check_config_drift.
+
+    Call before the event loop shuts down (e.g. at the end of a CLI command)
+    so no drift record is lost.
+
+    Example:
+        >>> result = await check_config_drift(memory)
+        >>> await flush_pending()
+
+    """
+    if _pending:
+        await asyncio.gather(*_pending, return_exceptions=True)
+
 
 async def check_config_drift(memory: MemoryManager, timeout: int = 10) -> DriftResult:
     """Detect configuration drift by comparing filesystem to VCS.
@@ -23,8 +71,10 @@ async def check_config_drift(memory: MemoryManager, timeout: int = 10) -> DriftR
     Workflow:
     1. Detects VCS type (git/jj) from filesystem or memory.
     2. Executes the appropriate status command (e.g., `git status` or `jj st`).
-    3. If changes are found, it logs them to memory with 'drift' metadata.
-    4. Returns a structured report to the agent.
+    3. If changes are found, it schedules a background write logging each
+       modified file to memory with 'drift' metadata.
+    4. Returns a structured report to the agent without waiting for the write
+       (see flush_pending).
 
     Args:
         memory: The core memory manager instance.
@@ -39,11 +89,12 @@ async def check_config_drift(memory: MemoryManager, timeout: int = 10) -> DriftR
             - message: Human-readable summary of the drift status.
 
     Raises:
-        Exception: Captures errors during VCS command execution or memory logging.
+        Exception: Captures errors during VCS command execution. Memory write
+            failures are logged by the background task.
 
     Side Effects:
-        - Persistent Memory: If drift is detected, adds a memory entry with
-          metadata `type: drift`.
+        - Persistent Memory: If drift is detected, adds one memory entry per
+          modified file with metadata `type: drift`, in a background task.
         - Subprocess: Executes shell commands for version control status.
 
     Note:
@@ -56,8 +107,15 @@ async def check_config_drift(memory: MemoryManager, timeout: int = 10) -> DriftR
         vcs_cmd = await get_vcs_command()
         vcs_type = vcs_cmd.vcs_type
         output = vcs_cmd.get_status(timeout=timeout)
-
-        if not output.strip():
+        # Single pass: strip each line once and keep only file-status lines
+        status_line = _STATUS_LINE_RE[vcs_type]
+        modified_files = [
+            stripped
+            for line in output.splitlines()
+            if status_line.match(stripped := line.strip())
+        ]
+
+        if not modified_files:
             return DriftResult(
                 status="clean",
                 vcs_type=vcs_type,
@@ -66,34 +124,29 @@ async def check_config_drift(memory: MemoryManager, timeout: int = 10) -> DriftR
                 message="No drift detected. System matches repository state.",
             )
 
-        modified_files = [line.strip() for line in output.splitlines() if line.strip()]
-
-        drift_text = f"""Drift detected
-        VCS: {vcs_type}
-        Level: {output}
-        """.strip()
-
-        response = await memory.add_with_redaction(
-            drift_text,
-            metadata={
-                "type": "drift",
-                "vcs": vcs_type,
-            },
+        # One entry per file lets mem0 deduplicate drift on a per-file basis.
+        # The write runs in the background so the caller gets the report
+        # without waiting on the LLM/embedding round-trips.
+        task = asyncio.create_task(
+            memory.add_many(
+                (
+                    f"Drift detected\nVCS: {vcs_type}\nFile: {modified_file}",
+                    {"type": "drift", "vcs": vcs_type},
+                )
+                for modified_file in modified_files
+            )
         )
+        _pending.add(task)
+        task.add_done_callback(_on_drift_recorded)
 
-        # Primary event
-        event = response.results[0]
+        memory_log = f"""⚠️ Drift detected (recording to memory)
 
-        memory_log = f"""✓ Drift detected and saved to memory
-
-        Memory ID: {event.id}
-        Event: {event.event}
         VCS: {vcs_type}
-        Level: {output}
-
-        {f"Note: {len(response.results)} memories affected" if len(response.results) > 1 else ""}""".strip()
+        Level: {output}""".strip()
 
-        logger.info(f"Drift detected and saved to memory (ID: {event.id}, Files: {len(modified_files)})")
+        logger.info(
+            "Drift detected, recording to memory (Files: %d)", len(modified_files)
+        )
         logger.debug(memory_log)
 
         return DriftResult(
@@ -105,7 +158,7 @@ async def check_config_drift(memory: MemoryManager, timeout: int = 10) -> DriftR
         )
 
     except Exception as e:
-        logger.error(f"Error checking drift: {str(e)}")
+        logger.error("Error checking drift: %s", e)
         return DriftResult(
             status="error",
             vcs_type="git",  # Default if error before detection
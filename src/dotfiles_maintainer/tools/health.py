@@ -55,10 +55,10 @@ async def health_check(
     # 1. Check Memory (Qdrant)
     try:
         # Simple ping by searching for something unlikely to exist, just to check connection
-        await memory_manager.search("health_check_ping", limit=1)
+        await memory_manager.search("health_check_ping", limit=1, use_cache=False)
         components["memory"] = "connected"
     except Exception as e:
-        logger.error(f"Health check failed for memory: {e}")
+        logger.error("Health check failed for memory: %s", e)
         components["memory"] = f"error: {str(e)}"
 
     # 2. Check VCS
@@ -66,7 +66,7 @@ async def health_check(
         vcs = await detect_vcs_type()
         components["vcs"] = f"active ({vcs})"
     except Exception as e:
-        logger.error(f"Health check failed for VCS: {e}")
+        logger.error("Health check failed for VCS: %s", e)
         components["vcs"] = f"error: {str(e)}"
 
     # 3. Check LLM
@@ -7,7 +7,7 @@ logs from version control systems.
 import logging
 
 from ..core.memory import MemoryManager
-from ..utils.vcs import VCSCommand, detect_vcs_type
+from ..utils.vcs import VCSCommand, detect_vcs_type, split_log_entries
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +24,8 @@ async def ingest_version_history(
     Workflow:
     1. Detects VCS type (git/jj).
     2. Retrieves the last N commit logs from version control.
-    3. Stores the combined history in semantic memory with 'history' metadata.
+    3. Stores each commit in semantic memory with 'history' metadata,
+       adding several commits concurrently.
 
     Args:
         memory: The core memory manager instance.
@@ -39,7 +40,7 @@ async def ingest_version_history(
         Exception: Captures errors during VCS command execution or memory addition.
 
     Side Effects:
-        - Persistent Memory: Adds a substantial new memory entry with
+        - Persistent Memory: Adds one memory entry per commit with
           metadata `type: history`.
         - Subprocess: Executes `git log` or `jj log`.
 
@@ -53,14 +54,16 @@ async def ingest_version_history(
         vcs = await detect_vcs_type()
         vcs_command = VCSCommand(vcs)
         output = vcs_command.get_log(count=count, timeout=timeout)
-        memory_msg = f"""Historical Context({vcs}):
-        {output}
-        """.strip()
-        response = await memory.add_with_redaction(
-            memory_msg, metadata={"type": "history", "vcs": vcs, "count": str(count)}
+        responses = await memory.add_many(
+            (
+                f"Historical Context({vcs}):\n{entry}",
+                {"type": "history", "vcs": vcs, "count": str(count)},
+            )
+            for entry in split_log_entries(output)
         )
+        events = [event for response in responses for event in response.results]
 
-        if not response.results:
+        if not events:
             duplicate_detected = f"""⚠️ Historical Context not ingested
 
             VCS: {vcs}
@@ -72,7 +75,7 @@ async def ingest_version_history(
             return duplicate_detected
 
         # Primary event
-        event = response.results[0]
+        event = events[0]
 
         memory_log = f"""✓ Ingested last {count} ({vcs}) commits to memory
 
@@ -83,9 +86,11 @@ async def ingest_version_history(
         {output}
         ```
 
-        {f"Note: {len(response.results)} memories affected" if len(response.results) > 1 else ""}""".strip()
+        {f"Note: {len(events)} memories affected" if len(events) > 1 else ""}""".strip()
 
-        logger.info(f"Ingested last {count} {vcs} commits to memory (ID: {event.id})")
+        logger.info(
+            "Ingested last %d %s commits to memory (ID: %s)", count, vcs, event.id
+        )
         logger.debug(memory_log)
         return memory_log
 
@@ -13,6 +13,24 @@ from ..core.types import AppConfig
 
 logger = logging.getLogger(__name__)
 
+_LIFECYCLE_TEMPLATE = """Lifecycle Event: {action}
+Target Config: {app_name}
+Replaced by: {replacement}
+Logic: {logic}"""
+
+_TIMESTAMP_TEMPLATE = "\nTimestamp: {timestamp}"
+
+_DUPLICATE_TEMPLATE = """⚠️ Lifecycle not logged (duplicate detected)
+
+{lifecycle}
+Note: A similar lifecycle was already recorded."""
+
+_LOGGED_TEMPLATE = """✓ Lifecycle event logged to memory
+
+Memory ID: {id}
+Event: {event}
+{lifecycle}"""
+
 
 async def track_lifecycle_events(
     memory: MemoryManager,
@@ -55,53 +73,50 @@ async def track_lifecycle_events(
 
     """
     try:
-        lifecycle_text = f"""
-        Lifecycle Event: {action}
-        Target Config: {old_config.app_name}
-        Replaced by: {new_config.app_name if new_config else "None"}
-        Logic: {logic}
-        Timestamp: {datetime.now(timezone.utc).isoformat()}
-        """.strip()
+        replacement = new_config.app_name if new_config else "None"
+        lifecycle = _LIFECYCLE_TEMPLATE.format(
+            action=action,
+            app_name=old_config.app_name,
+            replacement=replacement,
+            logic=logic,
+        )
+        timestamped = lifecycle + _TIMESTAMP_TEMPLATE.format(
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
 
         response = await memory.add_with_redaction(
-            lifecycle_text,
+            timestamped,
             metadata={
                 "type": "lifecycle",
                 "event": action,
                 "app": old_config.app_name,
-                "replacement": new_config.app_name if new_config else "None",
+                "replacement": replacement,
                 "logic": logic,
             },
         )
 
         if not response.results:
-            duplicate_detected = f"""⚠️ Lifecycle not logged (duplicate detected)
-
-            Lifecycle Event: {action}
-            Target Config: {old_config.app_name}
-            Replaced by: {new_config.app_name if new_config else "None"}
-            Logic: {logic}
-            Timestamp: {datetime.now(timezone.utc).isoformat()}
-            Note: A similar lifecycle was already recorded."""
-            logger.warning(f"Lifecycle event {action} for {old_config.app_name} duplicate detected.")
+            duplicate_detected = _DUPLICATE_TEMPLATE.format(lifecycle=timestamped)
+            logger.warning(
+                "Lifecycle event %s for %s duplicate detected.",
+                action,
+                old_config.app_name,
+            )
             logger.debug(duplicate_detected)
             return duplicate_detected
 
         # Primary event
         event = response.results[0]
 
-        memory_log = f"""✓ Lifecycle event logged to memory
-
-        Memory ID: {event.id}
-        Event: {event.event}
-        Lifecycle Event: {action}
-        Target Config: {old_config.app_name}
-        Replaced by: {new_config.app_name if new_config else "None"}
-        Logic: {logic}
-
-        {f"Note: {len(response.results)} memories affected" if len(response.results) > 1 else ""}""".strip()
+        memory_log = _LOGGED_TEMPLATE.format(
+            id=event.id, event=event.event, lifecycle=lifecycle
+        )
+        if len(response.results) > 1:
+            memory_log += f"\n\nNote: {len(response.results)} memories affected"
 
-        logger.info(f"Lifecycle event logged to memory (ID: {event.id}, Action: {action})")
+        logger.info(
+            "Lifecycle event logged to memory (ID: %s, Action: %s)", event.id, action
+        )
         logger.debug(memory_log)
         return memory_log
 
@@ -35,12 +35,14 @@ async def get_config_context(
     try:
         search_results = await memory.search(app_name)
         logger.debug(
-            f"Retrieved {len(search_results.results)} context results for '{app_name}'"
+            "Retrieved %d context results for '%s'",
+            len(search_results.results),
+            app_name,
         )
         return search_results.results
 
     except Exception as e:
-        logger.error(f"Failed to query '{app_name}': {e}")
+        logger.error("Failed to query '%s': %s", app_name, e)
         return []
 
 
@@ -69,12 +71,14 @@ async def search_change_history(
     try:
         search_results = await memory.search(search_query)
         logger.debug(
-            f"Retrieved {len(search_results.results)} history results for '{search_query}'"
+            "Retrieved %d history results for '%s'",
+            len(search_results.results),
+            search_query,
         )
         return search_results.results
 
     except Exception as e:
-        logger.error(f"Failed to query '{search_query}': {e}")
+        logger.error("Failed to query '%s': %s", search_query, e)
         return []
 
 
@@ -97,12 +101,14 @@ async def check_system_dependencies(
     try:
         search_results = await memory.search(tool_name)
         logger.debug(
-            f"Retrieved {len(search_results.results)} dependency results for '{tool_name}'"
+            "Retrieved %d dependency results for '%s'",
+            len(search_results.results),
+            tool_name,
         )
         return search_results.results
 
     except Exception as e:
-        logger.error(f"Failed to query '{tool_name}': {e}")
+        logger.error("Failed to query '%s': %s", tool_name, e)
         return []
 
 
@@ -132,7 +138,7 @@ async def sync_work_in_progress(
 
     """
     try:
-        files = [f.app_name for f in modified_files]
+        files = ", ".join(f.app_name for f in modified_files)
         msg = f"WIP Session Goal: {session_goal}\nModified: {files}\nStruggle: {current_struggle}"
         await memory.add_with_redaction(msg, metadata={"type": "wip"})
         logger.info("WIP session synchronized")
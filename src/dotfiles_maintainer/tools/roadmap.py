@@ -6,20 +6,69 @@ potential improvements for the configuration ecosystem.
 
 import logging
 from datetime import datetime, timezone
-from typing import Literal
+from enum import IntEnum
+from typing import Literal, get_args
 
+from ..core.errors import tool_error_boundary
 from ..core.memory import MemoryManager
-from ..core.types import MemoryResult
+from ..core.types import MemoryResult, MetadataValue
+
+__all__ = [
+    "Priority",
+    "RoadmapPriority",
+    "RoadmapStatus",
+    "log_conceptual_roadmap",
+    "query_roadmap",
+]
 
 logger = logging.getLogger(__name__)
 
+RoadmapStatus = Literal["pending", "blocked"]
+RoadmapPriority = Literal["LOW", "MEDIUM", "HIGH"]
+
+
+class Priority(IntEnum):
+    """Roadmap priority as stored in memory metadata."""
+
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+
+
+# Every query_roadmap search string, built once at import
+_ROADMAP_QUERIES: dict[tuple[str, str | None], str] = {
+    (status, priority): f"roadmap {status}"
+    + (f" {priority} priority" if priority else "")
+    for status in get_args(RoadmapStatus)
+    for priority in (None, *get_args(RoadmapPriority))
+}
+
+# Metadata stored per priority. mem0 deep-copies metadata and filters, so
+# these dicts are shared between calls.
+_ROADMAP_METADATA: dict[str, dict[str, MetadataValue]] = {
+    priority: {"type": "roadmap", "priority": Priority[priority].value}
+    for priority in get_args(RoadmapPriority)
+}
+_ROADMAP_FILTERS: dict[str, MetadataValue] = {"type": "roadmap"}
+
+
+def _has_priority(item: MemoryResult, priority: RoadmapPriority) -> bool:
+    """Return whether a roadmap item was logged with `priority`.
+
+    Entries logged before priorities were stored as Priority values hold the
+    label itself ("HIGH"), so both forms match.
+    """
+    stored = (item.metadata or {}).get("priority")
+    return stored == Priority[priority].value or stored == priority
 
+
+@tool_error_boundary("Failed to save Roadmap Entry")
 async def log_conceptual_roadmap(
     memory: MemoryManager,
     idea_title: str,
     hypothesis: str,
     blockers: str,
-    priority: Literal["LOW", "MEDIUM", "HIGH"],
+    priority: RoadmapPriority,
 ) -> str:
     """Store future ideas or "Nice to Have" features for later consideration.
 
@@ -40,34 +89,33 @@ async def log_conceptual_roadmap(
         - Persistent Memory: Adds a new memory entry with metadata `type: roadmap`.
 
     """
-    try:
-        roadmap_text = f"""Roadmap Idea: {idea_title}
-        Hypothesis: {hypothesis}
-        Blockers: {blockers}
-        Priority: {priority}
-        Timestamp: {datetime.now(timezone.utc).isoformat()}
-        """.strip()
-
-        response = await memory.add_with_redaction(
-            roadmap_text, metadata={"type": "roadmap", "priority": priority}
-        )
-
-        if not response.results:
-            duplicate_detected = f"""⚠️ Roadmap not logged (duplicate detected)
+    response = await memory.add_with_redaction_segments(
+        {
+            "Roadmap Idea": idea_title,
+            "Hypothesis": hypothesis,
+            "Blockers": blockers,
+            "Priority": priority,
+            "Timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        metadata=_ROADMAP_METADATA[priority],
+    )
+
+    if not response.results:
+        duplicate_detected = f"""⚠️ Roadmap not logged (duplicate detected)
 
             Roadmap Idea: {idea_title}
             Hypothesis: {hypothesis}
             Blockers: {blockers}
             Priority: {priority}
             Note: A similar roadmap was already recorded."""
-            logger.warning(f"Roadmap idea '{idea_title}' duplicate detected.")
-            logger.debug(duplicate_detected)
-            return duplicate_detected
+        logger.warning("Roadmap idea '%s' duplicate detected.", idea_title)
+        logger.debug(duplicate_detected)
+        return duplicate_detected
 
-        # Primary event
-        event = response.results[0]
+    # Primary event
+    event = response.results[0]
 
-        memory_log = f"""✓ Roadmap logged to memory
+    memory_log = f"""✓ Roadmap logged to memory
 
         Memory ID: {event.id}
         Event: {event.event}
@@ -78,20 +126,16 @@ async def log_conceptual_roadmap(
 
         {f"Note: {len(response.results)} memories affected" if len(response.results) > 1 else ""}""".strip()
 
-        logger.info(f"Roadmap idea '{idea_title}' logged to memory (ID: {event.id})")
-        logger.debug(memory_log)
-        return memory_log
-
-    except Exception as e:
-        err_msg = f"Failed to save Roadmap Entry: {e}"
-        logger.error(err_msg)
-        return err_msg
+    logger.info("Roadmap idea '%s' logged to memory (ID: %s)", idea_title, event.id)
+    logger.debug(memory_log)
+    return memory_log
 
 
+@tool_error_boundary("Failed to retrieve future ideas", lambda _: [])
 async def query_roadmap(
     memory: MemoryManager,
-    status: Literal["pending", "blocked"],
-    priority: Literal["LOW", "MEDIUM", "HIGH"] | None = None,
+    status: RoadmapStatus,
+    priority: RoadmapPriority | None = None,
 ) -> list[MemoryResult]:
     """Retrieve planned features or blocked ideas from the roadmap.
 
@@ -101,24 +145,20 @@ async def query_roadmap(
     Args:
         memory: The core memory manager instance.
         status: Filter by 'pending' (ready) or 'blocked' status.
-        priority: Optional filter for specific priority levels.
+        priority: Optional filter for specific priority levels, matched
+            against the stored metadata.
 
     Returns:
         A list of MemoryResult objects representing roadmap items.
 
     """
-    try:
-        query = f"roadmap {status}"
-        if priority:
-            query += f" {priority} priority"
-
-        search_results = await memory.search(query)
-
-        logger.debug(
-            f"Retrieved {len(search_results.results)} roadmap items for query '{query}'"
-        )
-        return search_results.results
-
-    except Exception as e:
-        logger.error(f"Failed to retrieve future ideas: {e}")
-        return []
+    query = _ROADMAP_QUERIES[(status, priority)]
+    search_results = await memory.search(query, filters=_ROADMAP_FILTERS)
+    items = search_results.results
+    # Applied here rather than in the store: the stored priority is an int
+    # for new entries but a string for older ones.
+    if priority:
+        items = [item for item in items if _has_priority(item, priority)]
+
+    logger.debug("Retrieved %d roadmap items for query '%s'", len(items), query)
+    return items
@@ -5,14 +5,43 @@ plugins during a temporary evaluation period.
 """
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+from ..core.errors import tool_error_boundary
 from ..core.memory import MemoryManager
-from ..core.types import MemoryResult
+from ..core.types import MemoryResult, MetadataValue
+
+__all__ = [
+    "list_active_trials",
+    "manage_trial",
+]
 
 logger = logging.getLogger(__name__)
 
+# Metadata stamped by manage_trial; lets the vector store skip everything else
+_ACTIVE_TRIAL_FILTERS: dict[str, MetadataValue] = {
+    "type": "trial",
+    "active": True,
+}
+
+
+def _started_before(trial: MemoryResult, cutoff: datetime) -> bool:
+    """Return whether a trial was created before `cutoff`.
+
+    Trials without a parseable timestamp are kept rather than hidden.
+    """
+    if not trial.created_at:
+        return True
+    try:
+        created_at = datetime.fromisoformat(trial.created_at)
+    except ValueError:
+        return True
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at <= cutoff
+
 
+@tool_error_boundary("Failed to set Trial for {name}")
 async def manage_trial(
     memory: MemoryManager,
     name: str,
@@ -39,33 +68,31 @@ async def manage_trial(
           `type: trial` and `active: True`.
 
     """
-    try:
-        trial_text = f"""
-        Tool/Plugin Trial: {name}
-        Trial Period: {trial_period} days
-        Success Criteria: {success_criteria}
-        Timestamp: {datetime.now(timezone.utc).isoformat()}
-        """.strip()
-
-        response = await memory.add_with_redaction(
-            trial_text, metadata={"type": "trial", "app": name, "active": True}
-        )
-
-        if not response.results:
-            duplicate_detected = f"""⚠️ Trial not started (duplicate detected)
+    response = await memory.add_with_redaction_segments(
+        {
+            "Tool/Plugin Trial": name,
+            "Trial Period": f"{trial_period} days",
+            "Success Criteria": success_criteria,
+            "Timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        metadata={"type": "trial", "app": name, "active": True},
+    )
+
+    if not response.results:
+        duplicate_detected = f"""⚠️ Trial not started (duplicate detected)
 
             Tool/Plugin: {name}
             Trial Period: {trial_period} days
             Success Criteria: {success_criteria}
             Note: A similar trial was already recorded."""
-            logger.warning(f"Trial for '{name}' duplicate detected.")
-            logger.debug(duplicate_detected)
-            return duplicate_detected
+        logger.warning("Trial for '%s' duplicate detected.", name)
+        logger.debug(duplicate_detected)
+        return duplicate_detected
 
-        # Primary event
-        event = response.results[0]
+    # Primary event
+    event = response.results[0]
 
-        memory_log = f"""✓ Trial Started and logged to memory
+    memory_log = f"""✓ Trial Started and logged to memory
 
         Memory ID: {event.id}
         Event: {event.event}
@@ -75,16 +102,12 @@ async def manage_trial(
 
         {f"Note: {len(response.results)} memories affected" if len(response.results) > 1 else ""}""".strip()
 
-        logger.info(f"Trial started for '{name}' (ID: {event.id})")
-        logger.debug(memory_log)
-        return memory_log
-
-    except Exception as e:
-        err_msg = f"Failed to set Trial for {name}: {e}"
-        logger.error(err_msg)
-        return err_msg
+    logger.info("Trial started for '%s' (ID: %s)", name, event.id)
+    logger.debug(memory_log)
+    return memory_log
 
 
+@tool_error_boundary("Failed to retrieve Trials", lambda _: [])
 async def list_active_trials(
     memory: MemoryManager, min_days_active: int
 ) -> list[MemoryResult]:
@@ -101,12 +124,16 @@ async def list_active_trials(
         A list of MemoryResult objects representing active trials.
 
     """
-    try:
-        _ = min_days_active
-        search_results = await memory.search("active plugin trials")
-        logger.debug(f"Retrieved {len(search_results.results)} active trials")
-        return search_results.results
-
-    except Exception as e:
-        logger.error(f"Failed to retrieve Trials: {e}")
-        return []
+    search_results = await memory.search(
+        "active plugin trials", filters=_ACTIVE_TRIAL_FILTERS
+    )
+    active_trials = search_results.results
+
+    # mem0's Qdrant filters only support equality, so the age check runs
+    # on the (already type-filtered) results.
+    if min_days_active > 0:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=min_days_active)
+        active_trials = [t for t in active_trials if _started_before(t, cutoff)]
+
+    logger.debug("Retrieved %d active trials", len(active_trials))
+    return active_trials
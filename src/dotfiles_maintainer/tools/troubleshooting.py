@@ -6,12 +6,22 @@ search the accumulated knowledge base to prevent re-solving the same issues.
 
 import logging
 
+from ..core.errors import tool_error_boundary
 from ..core.memory import MemoryManager
-from ..core.types import MemoryResult
+from ..core.types import MemoryResult, MetadataValue
+
+__all__ = [
+    "get_troubleshooting_guide",
+    "log_troubleshooting_event",
+]
 
 logger = logging.getLogger(__name__)
 
+# Metadata stamped by log_troubleshooting_event; keeps other memory types out
+_TROUBLESHOOT_FILTERS: dict[str, MetadataValue] = {"type": "troubleshoot"}
+
 
+@tool_error_boundary("Failed to add {error_signature} troubleshooting to memory")
 async def log_troubleshooting_event(
     memory: MemoryManager, error_signature: str, root_cause: str, fix_steps: str
 ) -> str:
@@ -34,32 +44,31 @@ async def log_troubleshooting_event(
           `type: troubleshoot`.
 
     """
-    try:
-        troubleshoot_text = f"""Troubleshooting: {error_signature}
-        Cause: {root_cause}
-        Fix: {fix_steps}
-        """
-        response = await memory.add_with_redaction(
-            troubleshoot_text,
-            metadata={"type": "troubleshoot", "error": error_signature},
-        )
-
-        if not response.results:
-            duplicate_detected = f"""⚠️ Troubleshooting Knowledge Base not updated (duplicate detected)
+    response = await memory.add_with_redaction_segments(
+        {
+            "Troubleshooting": error_signature,
+            "Cause": root_cause,
+            "Fix": fix_steps,
+        },
+        metadata={"type": "troubleshoot", "error": error_signature},
+    )
+
+    if not response.results:
+        duplicate_detected = f"""⚠️ Troubleshooting Knowledge Base not updated (duplicate detected)
 
             Troubleshooting: {error_signature}
             Cause: {root_cause}
             Fix: {fix_steps}
             Note: A similar Knowledge was already recorded."""
 
-            logger.warning(f"Troubleshooting duplicate detected for '{error_signature}'.")
-            logger.debug(duplicate_detected)
-            return duplicate_detected
+        logger.warning("Troubleshooting duplicate detected for '%s'.", error_signature)
+        logger.debug(duplicate_detected)
+        return duplicate_detected
 
-        # Primary event
-        event = response.results[0]
+    # Primary event
+    event = response.results[0]
 
-        memory_log = f"""✓ Troubleshooting Knowledge logged to memory
+    memory_log = f"""✓ Troubleshooting Knowledge logged to memory
 
         Memory ID: {event.id}
         Event: {event.event}
@@ -69,16 +78,18 @@ async def log_troubleshooting_event(
 
         {f"Note: {len(response.results)} memories affected" if len(response.results) > 1 else ""}""".strip()
 
-        logger.info(f"Troubleshooting knowledge logged for '{error_signature}' (ID: {event.id})")
-        logger.debug(memory_log)
-        return memory_log
-
-    except Exception as e:
-        err_msg = f"Failed to add {error_signature} troubleshooting to memory: {e}"
-        logger.error(err_msg)
-        return err_msg
+    logger.info(
+        "Troubleshooting knowledge logged for '%s' (ID: %s)",
+        error_signature,
+        event.id,
+    )
+    logger.debug(memory_log)
+    return memory_log
 
 
+@tool_error_boundary(
+    "Failed to retrieve logs for troubleshooting '{error_keyword}'", lambda _: []
+)
 async def get_troubleshooting_guide(
     memory: MemoryManager, error_keyword: str
 ) -> list[MemoryResult]:
@@ -92,18 +103,16 @@ async def get_troubleshooting_guide(
         error_keyword: Keywords from the current error to search for.
 
     Returns:
-        A list of MemoryResult objects containing past solutions.
+        A list of MemoryResult objects containing past solutions. Only
+        entries logged by log_troubleshooting_event are returned.
 
     """
-    try:
-        search_results = await memory.search(f"troubleshooting {error_keyword}")
-        logger.debug(
-            f"Retrieved {len(search_results.results)} troubleshooting logs for '{error_keyword}'"
-        )
-        return search_results.results
-
-    except Exception as e:
-        logger.error(
-            f"Failed to retrieve logs for troubleshooting '{error_keyword}': {e}"
-        )
-        return []
+    search_results = await memory.search(
+        f"troubleshooting {error_keyword}", filters=_TROUBLESHOOT_FILTERS
+    )
+    logger.debug(
+        "Retrieved %d troubleshooting logs for '%s'",
+        len(search_results.results),
+        error_keyword,
+    )
+    return search_results.results
@@ -6,12 +6,17 @@ found to be incorrect or outdated.
 
 import logging
 
-from ..core.memory import MemoryManager
+from ..core.errors import tool_error_boundary
+from ..core.memory import UNCHANGED_MESSAGE, MemoryManager
 from ..core.types import Mem0UpdateResponse
 
 logger = logging.getLogger(__name__)
 
 
+@tool_error_boundary(
+    "Error updating memory[{memory_id}]",
+    lambda err_msg: Mem0UpdateResponse(message=err_msg),
+)
 async def update_memory(
     memory: MemoryManager, memory_id: str, new_text: str
 ) -> Mem0UpdateResponse:
@@ -31,21 +36,18 @@ async def update_memory(
         new_text: The complete, corrected content of the memory.
 
     Returns:
-        A confirmation message stating the update was successful.
+        A confirmation message stating the update was successful, or that
+        the memory already held this text and was left untouched.
 
     Side Effects:
         - Persistent Memory: Modifies an existing entry in the vector database.
 
     """
-    try:
-        await memory.update(memory_id, new_text)
+    response = await memory.update(memory_id, new_text)
+    if response.message == UNCHANGED_MESSAGE:
+        msg = f"Memory {memory_id} unchanged (already up to date)."
+    else:
         msg = f"Memory {memory_id} updated successfully."
-        logger.info(msg)
-        output = Mem0UpdateResponse(message=msg)
-        return Mem0UpdateResponse.model_validate(output)
-
-    except Exception as e:
-        err_msg = f"Error updating memory[{memory_id}]: {e}"
-        logger.error(err_msg)
-        output = Mem0UpdateResponse(message=err_msg)
-        return Mem0UpdateResponse.model_validate(output)
+    logger.info(msg)
+    output = Mem0UpdateResponse(message=msg)
+    return Mem0UpdateResponse.model_validate(output)
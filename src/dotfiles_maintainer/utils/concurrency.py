@@ -0,0 +1,39 @@
+"""Asyncio concurrency helpers."""
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Memory writes are bound by the LLM/embedding provider; a handful of requests
+# in flight keeps throughput high without tripping provider rate limits.
+DEFAULT_CONCURRENCY = 8
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]], limit: int = DEFAULT_CONCURRENCY
+) -> list[T]:
+    """Await all awaitables concurrently with at most `limit` running at once.
+
+    Args:
+        awaitables: Coroutines or futures to run.
+        limit: Maximum number of awaitables in flight (default: 8).
+
+    Returns:
+        Results in the same order as the input.
+
+    Raises:
+        Exception: The first exception raised by any of the awaitables.
+
+    Example:
+        >>> results = await gather_bounded(memory.search(q) for q in queries)
+
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _one(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return list(await asyncio.gather(*(_one(aw) for aw in awaitables)))
@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 
 VCSType = Literal["git", "jj"]
 
+# Every entry produced by VCSCommand.get_log() ends with this line
+LOG_ENTRY_TERMINATOR = "---------------\n\n"
+
 
 # --- VCS Detection (Fast Path: Filesystem) ---
 
@@ -323,6 +326,24 @@ async def get_vcs_command(start_path: Path | None = None) -> VCSCommand:
     return VCSCommand(vcs_type, cwd=actual_path)
 
 
+def split_log_entries(output: str) -> list[str]:
+    """Split VCSCommand.get_log() output into one string per commit.
+
+    Args:
+        output: Raw log output from get_log()
+
+    Returns:
+        Non-empty commit entries in log order
+
+    Example:
+        >>> split_log_entries("a1 | 2026-01-01\\n---------------\\nfix\\n---------------\\n\\n")
+        ["a1 | 2026-01-01\\n---------------\\nfix"]
+
+    """
+    entries = (entry.strip() for entry in output.split(LOG_ENTRY_TERMINATOR))
+    return [entry for entry in entries if entry]
+
+
 def is_in_repo(path: Path | None = None) -> bool:
     """Check if path is inside a git or jj repository.
 
@@ -0,0 +1,51 @@
+"""Tests for the search result cache."""
+
+from unittest.mock import patch
+
+from dotfiles_maintainer.core.cache import SearchCache, normalize_query
+from dotfiles_maintainer.core.types import SearchResult
+
+
+def test_normalize_query():
+    assert normalize_query("  Roadmap \t PENDING\n") == "roadmap pending"
+
+
+def test_search_cache_ttl():
+    """Test entries expire after the TTL."""
+    cache = SearchCache(ttl=10)
+    result = SearchResult(results=[], relations=None)
+
+    with patch("dotfiles_maintainer.core.cache.time.monotonic", return_value=100.0):
+        cache.put(("q", 10, "u", ()), result, cache.version)
+
+    with patch("dotfiles_maintainer.core.cache.time.monotonic", return_value=105.0):
+        assert cache.get(("q", 10, "u", ())) is result
+
+    with patch("dotfiles_maintainer.core.cache.time.monotonic", return_value=111.0):
+        assert cache.get(("q", 10, "u", ())) is None
+    assert len(cache) == 0
+
+
+def test_search_cache_skips_stale_version():
+    """Test a result read before an invalidation is not stored."""
+    cache = SearchCache()
+    version = cache.version
+
+    cache.invalidate()
+    cache.put(("q", 10, "u", ()), SearchResult(results=[], relations=None), version)
+
+    assert cache.get(("q", 10, "u", ())) is None
+
+
+def test_search_cache_lru_eviction():
+    """Test the least recently used entry is evicted first."""
+    cache = SearchCache(max_size=2)
+    result = SearchResult(results=[], relations=None)
+
+    cache.put(("a", 10, "u", ()), result, cache.version)
+    cache.put(("b", 10, "u", ()), result, cache.version)
+    cache.get(("a", 10, "u", ()))
+    cache.put(("c", 10, "u", ()), result, cache.version)
+
+    assert cache.get(("a", 10, "u", ())) is result
+    assert cache.get(("b", 10, "u", ())) is None
@@ -1,6 +1,9 @@
 """Integration tests for the CLI entry point."""
 
+import asyncio
 import json
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -93,28 +96,65 @@ def test_cli_memory_inspect(mock_get_memory):
     mock_get_memory.return_value = mock_mm
 
     # Results
-    mock_mm.search = AsyncMock(
-        return_value=SearchResult(
-            results=[MemoryResult(id="1", memory="mem1", score=0.9)]
-        )
+    mock_mm.search_many = AsyncMock(
+        return_value=[
+            SearchResult(results=[MemoryResult(id="1", memory="mem1", score=0.9)])
+        ]
     )
     result = runner.invoke(app, ["memory", "inspect", "vim"])
     assert result.exit_code == 0
     assert "mem1" in result.stdout
+    mock_mm.search_many.assert_called_once_with(["vim"], limit=5)
+
+    # Several queries in one run
+    mock_mm.search_many = AsyncMock(
+        return_value=[
+            SearchResult(results=[MemoryResult(id="1", memory="mem1", score=0.9)]),
+            SearchResult(results=[]),
+        ]
+    )
+    result = runner.invoke(app, ["memory", "inspect", "vim", "tmux"])
+    assert result.exit_code == 0
+    assert "mem1" in result.stdout
+    assert "'tmux'" in result.stdout
+    assert "No matching memories found." in result.stdout
 
     # No results
-    mock_mm.search = AsyncMock(return_value=SearchResult(results=[]))
+    mock_mm.search_many = AsyncMock(return_value=[SearchResult(results=[])])
     result = runner.invoke(app, ["memory", "inspect", "vim"])
     assert result.exit_code == 0
     assert "No matching memories found." in result.stdout
 
     # Error
-    mock_mm.search.side_effect = Exception("boom")
+    mock_mm.search_many.side_effect = Exception("boom")
     result = runner.invoke(app, ["memory", "inspect", "vim"])
     assert result.exit_code == 0
     assert "Error: boom" in result.stdout
 
 
+@patch("dotfiles_maintainer.cli.get_memory")
+def test_cli_system_status(mock_get_memory):
+    mock_mm = MagicMock()
+    mock_get_memory.return_value = mock_mm
+    mock_mm.search = AsyncMock(
+        side_effect=[
+            SearchResult(results=[MemoryResult(id="r1", memory="try niri", score=1.0)]),
+            SearchResult(results=[]),
+            SearchResult(results=[MemoryResult(id="t1", memory="fix E492", score=1.0)]),
+        ]
+    )
+
+    result = runner.invoke(app, ["system", "status"])
+
+    assert result.exit_code == 0
+    assert "Pending Roadmap" in result.stdout
+    assert "try niri" in result.stdout
+    assert "Active Trials: nothing recorded." in result.stdout
+    assert "fix E492" in result.stdout
+    assert mock_mm.search.call_count == 3
+    mock_mm.search.assert_any_call("troubleshooting ", filters={"type": "troubleshoot"})
+
+
 @patch("dotfiles_maintainer.cli.get_memory")
 def test_cli_memory_facts(mock_get_memory):
     mock_mm = MagicMock()
@@ -213,9 +253,16 @@ def test_cli_tools_list(mock_mcp):
 def test_cli_get_memory():
     from dotfiles_maintainer.cli import get_memory
 
-    with patch("dotfiles_maintainer.cli.MemoryManager") as mock_mm:
-        manager = get_memory()
-        assert manager == mock_mm.return_value
+    get_memory.cache_clear()
+    try:
+        with patch("dotfiles_maintainer.cli.MemoryManager") as mock_mm:
+            manager = get_memory()
+            assert manager == mock_mm.return_value
+            # Subsequent commands reuse the same manager
+            assert get_memory() is manager
+            mock_mm.assert_called_once()
+    finally:
+        get_memory.cache_clear()
 
 
 @patch("dotfiles_maintainer.cli.MemoryManager")
@@ -275,6 +322,60 @@ def test_cli_tools_run(mock_mcp, mock_get_memory, mock_mm_class):
     assert "Execution Error: boom" in result.stdout
 
 
+@patch("dotfiles_maintainer.tools.drift.get_vcs_command", new_callable=AsyncMock)
+@patch("dotfiles_maintainer.cli.get_memory")
+@patch("dotfiles_maintainer.cli.mcp")
+def test_cli_tools_run_drift_recorded_before_exit(
+    mock_mcp, mock_get_memory, mock_get_vcs, monkeypatch
+):
+    from dotfiles_maintainer import cli
+    from dotfiles_maintainer.tools import drift
+
+    monkeypatch.setattr(cli, "_loop", None)
+    recorded = []
+
+    async def slow_add_many(items):
+        await asyncio.sleep(0.01)
+        recorded.extend(items)
+        return []
+
+    mock_mm = MagicMock()
+    mock_mm.add_many = slow_add_many
+    mock_get_memory.return_value = mock_mm
+    mock_get_vcs.return_value = MagicMock(vcs_type="git")
+    mock_get_vcs.return_value.get_status.return_value = " M .zshrc\n"
+
+    mock_tool = MagicMock()
+    mock_tool.fn = lambda ctx: drift.check_config_drift(
+        ctx.request_context.lifespan_context.memory
+    )
+    mock_mcp._tool_manager._tools = {"check_config_drift": mock_tool}
+
+    result = runner.invoke(app, ["tools", "run", "check_config_drift"])
+    assert result.exit_code == 0
+    assert recorded == []
+
+    # atexit handler: the pending write completes instead of being cancelled
+    shutdown_loop()
+    assert len(recorded) == 1
+    assert "File: M .zshrc" in recorded[0][0]
+
+
+def test_cli_shutdown_loop_logs_failed_drift_flush(monkeypatch, caplog):
+    from dotfiles_maintainer import cli
+
+    monkeypatch.setattr(cli, "_loop", asyncio.new_event_loop())
+
+    with patch(
+        "dotfiles_maintainer.tools.drift.flush_pending",
+        side_effect=RuntimeError("disk full"),
+    ):
+        shutdown_loop()
+
+    assert "Failed to flush pending drift records before exit" in caplog.text
+    assert "disk full" in caplog.text
+
+
 def test_cli_shutdown_loop():
     with patch("asyncio.all_tasks") as mock_tasks:
         mock_task = MagicMock()
@@ -284,6 +385,30 @@ def test_cli_shutdown_loop():
             mock_task.cancel.assert_called()
 
 
+def test_cli_import_does_not_load_mem0():
+    """Test that importing the CLI (e.g. for --help) leaves mem0 unloaded."""
+    code = "import sys, dotfiles_maintainer.cli; print('mem0' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_new_event_loop_prefers_uvloop():
+    from dotfiles_maintainer.cli import new_event_loop
+
+    fake_uvloop = MagicMock()
+    with patch.dict("sys.modules", {"uvloop": fake_uvloop}):
+        assert new_event_loop() is fake_uvloop.new_event_loop.return_value
+
+    with patch.dict("sys.modules", {"uvloop": None}):
+        loop = new_event_loop()
+        try:
+            assert isinstance(loop, asyncio.AbstractEventLoop)
+        finally:
+            loop.close()
+
+
 def test_cli_mock_context():
     from dotfiles_maintainer.cli import MockContext, MockRequest, MockLifespan
 
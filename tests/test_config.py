@@ -3,6 +3,8 @@
 import os
 from unittest.mock import patch
 
+from mem0.configs.vector_stores.qdrant import QdrantConfig
+
 from dotfiles_maintainer.config import ServerConfig
 
 
@@ -22,3 +24,49 @@ def test_server_config_ollama():
         assert llm_cfg.provider == "ollama"
         assert llm_cfg.config is not None
         assert llm_cfg.config["model"] == config.llm_model
+
+
+def test_server_config_embedder_fastembed():
+    """Test the embedder runs through FastEmbed with matching dimensions."""
+    config = ServerConfig()
+
+    embedder = config.memory_config.embedder
+    assert embedder.provider == "fastembed"
+    assert embedder.config is not None
+    assert embedder.config["model"] == config.embedding_model
+    assert embedder.config["embedding_dims"] == config.embedding_dims
+
+
+def test_server_config_qdrant_server(monkeypatch):
+    """Test the vector store uses a Qdrant server only when a URL is set."""
+    local = ServerConfig().memory_config.vector_store.config
+    assert isinstance(local, QdrantConfig)
+    assert local.url is None
+
+    monkeypatch.setenv("QDRANT_URL", "http://qdrant:6333")
+    monkeypatch.setenv("QDRANT_API_KEY", "secret")
+    remote = ServerConfig().memory_config.vector_store.config
+    assert isinstance(remote, QdrantConfig)
+    assert remote.url == "http://qdrant:6333"
+    assert remote.api_key == "secret"
+
+
+def test_server_config_memory_path_parent_created_once(tmp_path, monkeypatch):
+    """Test the storage parent directory is created once and paths are resolved."""
+    db_path = tmp_path / "nested" / "qdrant"
+    monkeypatch.setenv("DOTFILES_MEMORY_PATH", str(db_path))
+
+    with patch("dotfiles_maintainer.config.Path.mkdir") as mock_mkdir:
+        first = ServerConfig()
+        second = ServerConfig()
+
+    assert first.memory_db_path == second.memory_db_path == db_path.resolve()
+    mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+
+    monkeypatch.setenv("DOTFILES_MEMORY_PATH", str(tmp_path / "nested" / ".." / "db"))
+    assert ServerConfig().memory_db_path == tmp_path.resolve() / "db"
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("DOTFILES_MEMORY_PATH", "relative/qdrant")
+    relative = ServerConfig()
+    assert relative.memory_db_path == tmp_path.resolve() / "relative" / "qdrant"
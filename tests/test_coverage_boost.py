@@ -2,12 +2,14 @@
 
 import os
 import shutil
+from functools import partial
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
 from dotfiles_maintainer.config import ServerConfig
+from dotfiles_maintainer.core.errors import MemoryBackendError
 from dotfiles_maintainer.core.memory import MemoryManager, MemorySearchError
 from dotfiles_maintainer.core.types import (
     Mem0AddResponse,
@@ -35,7 +37,7 @@ from dotfiles_maintainer.tools import (
 @pytest.mark.asyncio
 async def test_memory_manager_validation_errors():
     config = ServerConfig()
-    with patch("dotfiles_maintainer.core.memory.AsyncMemory") as mock_async_mem:
+    with patch("mem0.AsyncMemory") as mock_async_mem:
         client = mock_async_mem.return_value
         manager = MemoryManager(config)
 
@@ -59,14 +61,14 @@ async def test_memory_manager_validation_errors():
         client.update = AsyncMock(
             side_effect=ValidationError.from_exception_data("test", [])
         )
-        with pytest.raises(ValidationError):
+        with pytest.raises(MemoryBackendError, match="Invalid update response"):
             await manager.update("id", "test")
 
 
 @pytest.mark.asyncio
 async def test_memory_manager_get_all_and_delete():
     config = ServerConfig()
-    with patch("dotfiles_maintainer.core.memory.AsyncMemory") as mock_async_mem:
+    with patch("mem0.AsyncMemory") as mock_async_mem:
         client = mock_async_mem.return_value
         manager = MemoryManager(config)
 
@@ -97,7 +99,7 @@ async def test_memory_manager_reset():
     config.memory_db_path = Path("./test_qdrant")
     config.memory_db_path.mkdir(parents=True, exist_ok=True)
 
-    with patch("dotfiles_maintainer.core.memory.AsyncMemory") as mock_async_mem:
+    with patch("mem0.AsyncMemory") as mock_async_mem:
         client = mock_async_mem.return_value
         manager = MemoryManager(config)
 
@@ -197,6 +199,10 @@ async def test_tools_empty_results(
 ):
     memory = MagicMock()
     memory.add_with_redaction = AsyncMock(return_value=Mem0AddResponse(results=[]))
+    memory.add_with_redaction_segments = AsyncMock(
+        return_value=Mem0AddResponse(results=[])
+    )
+    memory.add_many = partial(MemoryManager.add_many, memory)
 
     # baseline
     res = await baseline.initialize_system_baseline(
@@ -235,6 +241,10 @@ async def test_tools_empty_results(
 async def test_tools_exceptions(mock_system_metadata, mock_app_config, mock_app_change):
     memory = MagicMock()
     memory.add_with_redaction = AsyncMock(side_effect=Exception("boom"))
+    memory.add_with_redaction_segments = AsyncMock(
+        side_effect=MemoryBackendError("boom")
+    )
+    memory.add_many = partial(MemoryManager.add_many, memory)
     memory.search = AsyncMock(side_effect=Exception("boom"))
 
     assert "Failed" in await baseline.initialize_system_baseline(
@@ -1,9 +1,11 @@
 """Tests for the MemoryManager core module."""
 
+import hashlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from dotfiles_maintainer.config import ServerConfig
+from dotfiles_maintainer.core.errors import MemoryBackendError
 from dotfiles_maintainer.core.memory import MemoryManager, MemorySearchError
 from dotfiles_maintainer.core.types import (
     Mem0AddResponse,
@@ -20,6 +22,7 @@ def mock_config() -> ServerConfig:
     """Fixture for mocking server configuration."""
     config = MagicMock(spec=ServerConfig)
     config.user_id = "test_user"
+    config.enable_quantization = False
     # Ensure memory_config is also mocked or a valid object if needed
     config.memory_config = MagicMock()
     return config
@@ -37,9 +40,7 @@ def memory_manager(
     mock_config: ServerConfig, mock_mem0_client: AsyncMock
 ) -> MemoryManager:
     """Fixture for creating MemoryManager with mocked dependencies."""
-    with patch(
-        "dotfiles_maintainer.core.memory.AsyncMemory", return_value=mock_mem0_client
-    ):
+    with patch("mem0.AsyncMemory", return_value=mock_mem0_client):
         manager = MemoryManager(mock_config)
         # Ensure the client is indeed our mock (patch should handle this, but good to be sure)
         manager.client = mock_mem0_client
@@ -99,7 +100,7 @@ async def test_search_success(
 
     # Verify
     mock_mem0_client.search.assert_called_once_with(
-        query, user_id="test_user", limit=10
+        query, user_id="test_user", limit=10, filters=None
     )
     assert isinstance(result, SearchResult)
     assert result.results[0].id == "1"
@@ -141,7 +142,7 @@ async def test_add_with_redaction_failure(
 ) -> None:
     """Test memory addition failure."""
     mock_mem0_client.add.side_effect = Exception("Add failed")
-    with pytest.raises(Exception, match="Add failed"):
+    with pytest.raises(MemoryBackendError, match="Add failed"):
         await memory_manager.add_with_redaction("text")
 
 
@@ -166,11 +167,204 @@ async def test_search_empty_result(
     assert len(result.results) == 0
 
 
+@pytest.mark.asyncio
+async def test_update_skips_unchanged_content(
+    memory_manager: MemoryManager, mock_mem0_client: AsyncMock
+) -> None:
+    """Test that resubmitting the stored text does not rewrite the memory."""
+    text = "zsh uses starship"
+    mock_mem0_client.get.return_value = {
+        "id": "123",
+        "memory": text,
+        "hash": hashlib.md5(text.encode()).hexdigest(),
+    }
+
+    result = await memory_manager.update("123", text)
+
+    assert result.message == "Memory unchanged"
+    mock_mem0_client.get.assert_called_once_with("123")
+    mock_mem0_client.update.assert_not_called()
+
+    # Changed content is written
+    mock_mem0_client.update.return_value = {"message": "Memory updated successfully!"}
+    await memory_manager.update("123", "zsh uses pure")
+    mock_mem0_client.update.assert_called_once_with(
+        data="zsh uses pure", memory_id="123"
+    )
+
+
 @pytest.mark.asyncio
 async def test_update_failure(
     memory_manager: MemoryManager, mock_mem0_client: AsyncMock
 ) -> None:
     """Test update failure."""
     mock_mem0_client.update.side_effect = Exception("Update failed")
-    with pytest.raises(Exception, match="Update failed"):
+    with pytest.raises(MemoryBackendError, match="Update failed"):
         await memory_manager.update("123", "text")
+
+
+def test_init_enables_quantization(mock_config: ServerConfig) -> None:
+    """Test that the collection is switched to int8 quantization on startup."""
+    mock_config.enable_quantization = True
+    mock_config.hnsw_m = 32
+    mock_config.hnsw_ef_construct = 200
+    client = MagicMock()
+    client.vector_store.collection_name = "mem0"
+    client.vector_store.is_local = False
+
+    with patch("mem0.AsyncMemory", return_value=client):
+        MemoryManager(mock_config)
+
+    update = client.vector_store.client.update_collection
+    update.assert_called_once()
+    kwargs = update.call_args.kwargs
+    assert kwargs["collection_name"] == "mem0"
+    assert kwargs["quantization_config"].scalar.always_ram is True
+    assert kwargs["collection_params"].on_disk_payload is True
+    assert kwargs["hnsw_config"].m == 32
+    assert kwargs["hnsw_config"].ef_construct == 200
+
+
+def test_init_skips_tuning_for_embedded_store(mock_config: ServerConfig) -> None:
+    """Test that the embedded store, which ignores collection updates, is left alone."""
+    mock_config.enable_quantization = True
+    client = MagicMock()
+    client.vector_store.is_local = True
+
+    with patch("mem0.AsyncMemory", return_value=client):
+        MemoryManager(mock_config)
+
+    client.vector_store.client.update_collection.assert_not_called()
+
+
+def test_init_quantization_failure_is_ignored(mock_config: ServerConfig) -> None:
+    """Test that a store rejecting the collection update does not break init."""
+    mock_config.enable_quantization = True
+    client = MagicMock()
+    client.vector_store.is_local = False
+    client.vector_store.client.update_collection.side_effect = RuntimeError("no")
+
+    with patch("mem0.AsyncMemory", return_value=client):
+        manager = MemoryManager(mock_config)
+
+    assert manager.client is client
+
+
+@pytest.mark.asyncio
+async def test_search_cached_until_write(
+    memory_manager: MemoryManager, mock_mem0_client: AsyncMock
+) -> None:
+    """Test repeated searches are cached and writes invalidate the cache."""
+    mock_mem0_client.search.return_value = {"results": []}
+    mock_mem0_client.add.return_value = {"results": []}
+
+    first = await memory_manager.search("zsh", limit=5)
+    second = await memory_manager.search("zsh", limit=5)
+    assert first is second
+    assert mock_mem0_client.search.call_count == 1
+
+    # Different limit is a different key; use_cache=False always hits the store
+    await memory_manager.search("zsh", limit=1)
+    await memory_manager.search("zsh", limit=5, use_cache=False)
+    assert mock_mem0_client.search.call_count == 3
+
+    await memory_manager.add_with_redaction("new fact")
+    await memory_manager.search("zsh", limit=5)
+    assert mock_mem0_client.search.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_search_cache_normalizes_query(
+    memory_manager: MemoryManager, mock_mem0_client: AsyncMock
+) -> None:
+    """Test queries differing only in case/whitespace share a cache entry."""
+    mock_mem0_client.search.return_value = {"results": []}
+
+    await memory_manager.search("Roadmap  pending")
+    await memory_manager.search(" roadmap PENDING ")
+
+    # The store still receives the query as written
+    mock_mem0_client.search.assert_called_once_with(
+        "Roadmap  pending", user_id="test_user", limit=10, filters=None
+    )
+
+    memory_manager.invalidate_search_cache()
+    await memory_manager.search("roadmap pending")
+    assert mock_mem0_client.search.call_count == 2
+
+    # Filters are part of the key
+    await memory_manager.search("roadmap pending", filters={"type": "roadmap"})
+    await memory_manager.search("roadmap pending", filters={"type": "roadmap"})
+    assert mock_mem0_client.search.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_search_cache_evicts_oldest(
+    memory_manager: MemoryManager, mock_mem0_client: AsyncMock
+) -> None:
+    """Test the search cache is bounded."""
+    mock_mem0_client.search.return_value = {"results": []}
+
+    memory_manager.search_cache.max_size = 2
+    await memory_manager.search("a")
+    await memory_manager.search("b")
+    await memory_manager.search("c")
+    await memory_manager.search("a")
+
+    assert mock_mem0_client.search.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_add_many(
+    memory_manager: MemoryManager, mock_mem0_client: AsyncMock
+) -> None:
+    """Test several records are added separately and returned in order."""
+    mock_mem0_client.add.side_effect = lambda messages, **_: {
+        "results": [{"id": messages, "memory": messages, "event": "ADD"}]
+    }
+
+    responses = await memory_manager.add_many(
+        [("first", {"type": "baseline"}), ("second", None)]
+    )
+
+    assert [r.results[0].id for r in responses] == ["first", "second"]
+    assert mock_mem0_client.add.call_count == 2
+    mock_mem0_client.add.assert_any_call(
+        messages="second", user_id="test_user", metadata=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_many(
+    memory_manager: MemoryManager, mock_mem0_client: AsyncMock
+) -> None:
+    """Test several queries are searched and returned in order."""
+    mock_mem0_client.search.side_effect = lambda query, **_: {
+        "results": [{"id": query, "memory": query, "score": 1.0}]
+    }
+
+    results = await memory_manager.search_many(["roadmap pending", "trials"], limit=3)
+
+    assert [r.results[0].id for r in results] == ["roadmap pending", "trials"]
+    mock_mem0_client.search.assert_any_call(
+        "trials", user_id="test_user", limit=3, filters=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_with_redaction_segments(
+    memory_manager: MemoryManager, mock_mem0_client: AsyncMock
+) -> None:
+    """Test labeled fields are redacted individually and joined per line."""
+    mock_mem0_client.add.return_value = {"results": []}
+
+    await memory_manager.add_with_redaction_segments(
+        {"Cause": "leaked token=abc123", "Fix": "rotate it"},
+        metadata={"type": "troubleshoot"},
+    )
+
+    mock_mem0_client.add.assert_called_once_with(
+        messages="Cause: leaked token: [REDACTED]\nFix: rotate it",
+        user_id="test_user",
+        metadata={"type": "troubleshoot"},
+    )
@@ -1,8 +1,11 @@
 """Unit tests for all MCP tools."""
 
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from dotfiles_maintainer.core.errors import MemoryBackendError, tool_error_boundary
 from dotfiles_maintainer.core.memory import MemoryManager
 from dotfiles_maintainer.core.types import (
     AppChange,
@@ -33,6 +36,9 @@ from dotfiles_maintainer.tools import (
 def mock_memory_manager():
     manager = MagicMock(spec=MemoryManager)
     manager.add_with_redaction = AsyncMock()
+    manager.add_with_redaction_segments = AsyncMock()
+    # Real fan-out so per-record add_with_redaction calls stay observable
+    manager.add_many = partial(MemoryManager.add_many, manager)
     manager.search = AsyncMock()
     manager.update = AsyncMock()
     return manager
@@ -73,9 +79,14 @@ async def test_initialize_system_baseline_success(mock_memory_manager):
     )
 
     assert "System Baseline Initialized" in result
-    mock_memory_manager.add_with_redaction.assert_called_once()
-    call_args = mock_memory_manager.add_with_redaction.call_args
-    assert call_args.kwargs["metadata"]["type"] == "baseline"
+    # One record for the system plus one per app config
+    assert mock_memory_manager.add_with_redaction.call_count == 2
+    system_call, vim_call = mock_memory_manager.add_with_redaction.call_args_list
+    assert system_call.args[1]["type"] == "baseline"
+    assert "Dotfile Manager: stow" in system_call.args[0]
+    assert '"version_control":"git"' in system_call.args[0]
+    assert vim_call.args[1]["app"] == "vim"
+    assert '"app_name":"vim"' in vim_call.args[0]
 
 
 @pytest.mark.asyncio
@@ -120,6 +131,29 @@ async def test_commit_contextual_change_success(mock_memory_manager):
     assert "abc1234" in mock_memory_manager.add_with_redaction.call_args[0][0]
 
 
+@pytest.mark.asyncio
+async def test_commit_contextual_change_without_commit(mock_memory_manager):
+    data = AppChange(
+        app_name="zsh",
+        change_type="fix",
+        rationale="typo",
+        improvement_metric="none",
+        description="fixed alias",
+        source_path="src",
+        destination_path="dest",
+        file_structure="monolithic",
+    )
+    mock_memory_manager.add_with_redaction.return_value = Mem0AddResponse(
+        results=[Mem0Event(id="1", memory="change", event="ADD")]
+    )
+
+    await changes.commit_contextual_change(mock_memory_manager, data)
+
+    change_text = mock_memory_manager.add_with_redaction.call_args[0][0]
+    assert change_text.startswith("Configuration Change: zsh\nType: fix\n")
+    assert "VCS Commit" not in change_text
+
+
 # --- Drift Tools ---
 
 
@@ -136,7 +170,28 @@ async def test_check_config_drift_git_detected(mock_get_vcs, mock_memory_manager
     assert result.status == "modified"
     assert result.vcs_type == "git"
     assert "M .zshrc" in result.message
+
+    # The memory write runs in the background until flushed
+    await drift.flush_pending()
     mock_memory_manager.add_with_redaction.assert_called_once()
+    assert not drift._pending
+
+
+@pytest.mark.asyncio
+@patch("dotfiles_maintainer.tools.drift.get_vcs_command", new_callable=AsyncMock)
+async def test_check_config_drift_memory_failure(mock_get_vcs, mock_memory_manager):
+    mock_vcs_cmd = MagicMock()
+    mock_vcs_cmd.vcs_type = "git"
+    mock_vcs_cmd.get_status.return_value = "M .zshrc\n"
+    mock_get_vcs.return_value = mock_vcs_cmd
+    mock_memory_manager.add_with_redaction.side_effect = Exception("Add error")
+
+    result = await drift.check_config_drift(mock_memory_manager)
+    await drift.flush_pending()
+
+    # A failed background write does not change the reported drift
+    assert result.status == "modified"
+    assert not drift._pending
 
 
 @pytest.mark.asyncio
@@ -153,6 +208,66 @@ async def test_check_config_drift_no_drift(mock_get_vcs, mock_memory_manager):
     mock_memory_manager.add_with_redaction.assert_not_called()
 
 
+@pytest.mark.asyncio
+@patch("dotfiles_maintainer.tools.drift.get_vcs_command", new_callable=AsyncMock)
+async def test_check_config_drift_strips_lines(mock_get_vcs, mock_memory_manager):
+    mock_vcs_cmd = MagicMock()
+    mock_vcs_cmd.vcs_type = "git"
+    mock_vcs_cmd.get_status.return_value = "\n M .zshrc \n   \n?? .vimrc\n"
+    mock_get_vcs.return_value = mock_vcs_cmd
+
+    result = await drift.check_config_drift(mock_memory_manager)
+
+    assert result.modified_files == ["M .zshrc", "?? .vimrc"]
+    assert result.total_changes == 2
+    await drift.flush_pending()
+
+
+@pytest.mark.asyncio
+@patch("dotfiles_maintainer.tools.drift.get_vcs_command", new_callable=AsyncMock)
+async def test_check_config_drift_skips_jj_headers(mock_get_vcs, mock_memory_manager):
+    mock_vcs_cmd = MagicMock()
+    mock_vcs_cmd.vcs_type = "jj"
+    mock_vcs_cmd.get_status.return_value = (
+        "Working copy changes:\n"
+        "M .zshrc\n"
+        "A nvim/init.lua\n"
+        "R tmux/{tmux.conf => tmux.conf.bak}\n"
+        "Working copy  (@) : kmkuslsw 3f1a2b4c (no description set)\n"
+        "Parent commit (@-): zzzzzzzz 00000000 (empty) init\n"
+    )
+    mock_get_vcs.return_value = mock_vcs_cmd
+
+    result = await drift.check_config_drift(mock_memory_manager)
+    await drift.flush_pending()
+
+    assert result.modified_files == [
+        "M .zshrc",
+        "A nvim/init.lua",
+        "R tmux/{tmux.conf => tmux.conf.bak}",
+    ]
+    assert result.total_changes == 3
+    assert mock_memory_manager.add_with_redaction.call_count == 3
+
+
+@pytest.mark.asyncio
+@patch("dotfiles_maintainer.tools.drift.get_vcs_command", new_callable=AsyncMock)
+async def test_check_config_drift_jj_clean(mock_get_vcs, mock_memory_manager):
+    mock_vcs_cmd = MagicMock()
+    mock_vcs_cmd.vcs_type = "jj"
+    mock_vcs_cmd.get_status.return_value = (
+        "The working copy has no changes.\n"
+        "Working copy  (@) : kmkuslsw 3f1a2b4c (empty) (no description set)\n"
+        "Parent commit (@-): zzzzzzzz 00000000 init\n"
+    )
+    mock_get_vcs.return_value = mock_vcs_cmd
+
+    result = await drift.check_config_drift(mock_memory_manager)
+
+    assert result.status == "clean"
+    mock_memory_manager.add_with_redaction.assert_not_called()
+
+
 # --- History Tools ---
 
 
@@ -177,6 +292,29 @@ async def test_ingest_version_history_success(
     mock_memory_manager.add_with_redaction.assert_called_once()
 
 
+@pytest.mark.asyncio
+@patch("dotfiles_maintainer.tools.history.detect_vcs_type", new_callable=AsyncMock)
+@patch("dotfiles_maintainer.tools.history.VCSCommand")
+async def test_ingest_version_history_one_memory_per_commit(
+    mock_vcs_cls, mock_detect_vcs, mock_memory_manager
+):
+    mock_detect_vcs.return_value = "git"
+    mock_vcs_cls.return_value.get_log.return_value = (
+        "a1 | 2026-01-02\n---------------\nfeat\n\n---------------\n\n"
+        "b2 | 2026-01-01\n---------------\nfix\n\n---------------\n\n"
+    )
+    mock_memory_manager.add_with_redaction.return_value = Mem0AddResponse(
+        results=[Mem0Event(id="1", memory="log", event="ADD")]
+    )
+
+    result = await history.ingest_version_history(mock_memory_manager, count=2)
+
+    assert "2 memories affected" in result
+    assert mock_memory_manager.add_with_redaction.call_count == 2
+    texts = [c.args[0] for c in mock_memory_manager.add_with_redaction.call_args_list]
+    assert "feat" in texts[0] and "fix" in texts[1]
+
+
 # --- Lifecycle Tools ---
 
 
@@ -288,6 +426,7 @@ async def test_sync_work_in_progress(mock_memory_manager):
 
     assert "WIP synchronized" in result
     mock_memory_manager.add_with_redaction.assert_called_once()
+    assert "Modified: tmux\n" in mock_memory_manager.add_with_redaction.call_args[0][0]
 
 
 @pytest.mark.asyncio
@@ -311,7 +450,7 @@ async def test_sync_work_in_progress_failure(mock_memory_manager):
 
 @pytest.mark.asyncio
 async def test_log_conceptual_roadmap(mock_memory_manager):
-    mock_memory_manager.add_with_redaction.return_value = Mem0AddResponse(
+    mock_memory_manager.add_with_redaction_segments.return_value = Mem0AddResponse(
         results=[Mem0Event(id="1", memory="roadmap", event="ADD")]
     )
     result = await roadmap.log_conceptual_roadmap(
@@ -319,20 +458,72 @@ async def test_log_conceptual_roadmap(mock_memory_manager):
     )
 
     assert "Roadmap logged" in result
-    mock_memory_manager.add_with_redaction.assert_called_once()
+    mock_memory_manager.add_with_redaction_segments.assert_called_once()
+    _, kwargs = mock_memory_manager.add_with_redaction_segments.call_args
+    assert kwargs["metadata"] == {"type": "roadmap", "priority": 3}
 
 
 @pytest.mark.asyncio
 async def test_query_roadmap(mock_memory_manager):
     mock_memory_manager.search.return_value = SearchResult(
-        results=[MemoryResult(id="1", memory="idea 1", score=1.0)]
+        results=[
+            MemoryResult(
+                id="1",
+                memory="idea 1",
+                score=1.0,
+                metadata={"type": "roadmap", "priority": 3},
+            ),
+            MemoryResult(
+                id="2",
+                memory="idea 2",
+                score=0.9,
+                metadata={"type": "roadmap", "priority": 1},
+            ),
+        ]
     )
 
     result = await roadmap.query_roadmap(mock_memory_manager, "pending", "HIGH")
 
     assert len(result) == 1
     assert result[0].memory == "idea 1"
-    mock_memory_manager.search.assert_called_once_with("roadmap pending HIGH priority")
+    mock_memory_manager.search.assert_called_once_with(
+        "roadmap pending HIGH priority", filters={"type": "roadmap"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_query_roadmap_matches_legacy_string_priority(mock_memory_manager):
+    mock_memory_manager.search.return_value = SearchResult(
+        results=[
+            MemoryResult(
+                id="old",
+                memory="legacy idea",
+                score=1.0,
+                metadata={"type": "roadmap", "priority": "HIGH"},
+            ),
+            MemoryResult(
+                id="low",
+                memory="legacy low idea",
+                score=0.9,
+                metadata={"type": "roadmap", "priority": "LOW"},
+            ),
+        ]
+    )
+
+    result = await roadmap.query_roadmap(mock_memory_manager, "pending", "HIGH")
+
+    assert [item.id for item in result] == ["old"]
+
+
+@pytest.mark.asyncio
+async def test_query_roadmap_without_priority(mock_memory_manager):
+    mock_memory_manager.search.return_value = SearchResult(results=[])
+
+    await roadmap.query_roadmap(mock_memory_manager, "blocked")
+
+    mock_memory_manager.search.assert_called_once_with(
+        "roadmap blocked", filters={"type": "roadmap"}
+    )
 
 
 # --- Trials Tools ---
@@ -340,13 +531,13 @@ async def test_query_roadmap(mock_memory_manager):
 
 @pytest.mark.asyncio
 async def test_manage_trial(mock_memory_manager):
-    mock_memory_manager.add_with_redaction.return_value = Mem0AddResponse(
+    mock_memory_manager.add_with_redaction_segments.return_value = Mem0AddResponse(
         results=[Mem0Event(id="1", memory="trial", event="ADD")]
     )
     result = await trials.manage_trial(mock_memory_manager, "plugin-x", 7, "works well")
 
     assert "Trial Started" in result
-    mock_memory_manager.add_with_redaction.assert_called_once()
+    mock_memory_manager.add_with_redaction_segments.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -355,11 +546,39 @@ async def test_list_active_trials(mock_memory_manager):
         results=[MemoryResult(id="1", memory="trial 1", score=1.0)]
     )
 
-    result = await trials.list_active_trials(mock_memory_manager, 3)
+    result = await trials.list_active_trials(mock_memory_manager, 0)
 
     assert len(result) == 1
     assert result[0].memory == "trial 1"
-    mock_memory_manager.search.assert_called_once_with("active plugin trials")
+    mock_memory_manager.search.assert_called_once_with(
+        "active plugin trials", filters={"type": "trial", "active": True}
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_active_trials_min_days(mock_memory_manager):
+    now = datetime.now(timezone.utc)
+    mock_memory_manager.search.return_value = SearchResult(
+        results=[
+            MemoryResult(
+                id="old",
+                memory="trial old",
+                score=1.0,
+                created_at=(now - timedelta(days=10)).isoformat(),
+            ),
+            MemoryResult(
+                id="new",
+                memory="trial new",
+                score=1.0,
+                created_at=(now - timedelta(days=1)).isoformat(),
+            ),
+            MemoryResult(id="unknown", memory="trial unknown", score=1.0),
+        ]
+    )
+
+    result = await trials.list_active_trials(mock_memory_manager, 7)
+
+    assert [trial.id for trial in result] == ["old", "unknown"]
 
 
 # --- Troubleshooting Tools ---
@@ -367,7 +586,7 @@ async def test_list_active_trials(mock_memory_manager):
 
 @pytest.mark.asyncio
 async def test_log_troubleshooting_event(mock_memory_manager):
-    mock_memory_manager.add_with_redaction.return_value = Mem0AddResponse(
+    mock_memory_manager.add_with_redaction_segments.return_value = Mem0AddResponse(
         results=[Mem0Event(id="1", memory="troubleshooting", event="ADD")]
     )
     result = await troubleshooting.log_troubleshooting_event(
@@ -375,7 +594,9 @@ async def test_log_troubleshooting_event(mock_memory_manager):
     )
 
     assert "Troubleshooting Knowledge logged" in result
-    mock_memory_manager.add_with_redaction.assert_called_once()
+    mock_memory_manager.add_with_redaction_segments.assert_called_once()
+    segments = mock_memory_manager.add_with_redaction_segments.call_args.args[0]
+    assert segments == {"Troubleshooting": "error", "Cause": "cause", "Fix": "fix"}
 
 
 @pytest.mark.asyncio
@@ -390,7 +611,9 @@ async def test_get_troubleshooting_guide(mock_memory_manager):
 
     assert len(result) == 1
     assert result[0].memory == "solution"
-    mock_memory_manager.search.assert_called_once_with("troubleshooting error")
+    mock_memory_manager.search.assert_called_once_with(
+        "troubleshooting error", filters={"type": "troubleshoot"}
+    )
 
 
 # --- Updates Tools ---
@@ -407,9 +630,21 @@ async def test_update_memory_success(mock_memory_manager):
     mock_memory_manager.update.assert_called_once_with("id-1", "new text")
 
 
+@pytest.mark.asyncio
+async def test_update_memory_unchanged(mock_memory_manager):
+    mock_memory_manager.update.return_value = Mem0UpdateResponse(
+        id="id-1", text="same text", message="Memory unchanged"
+    )
+    result = await updates.update_memory(mock_memory_manager, "id-1", "same text")
+
+    assert result.message is not None
+    assert "unchanged" in result.message
+    assert "updated successfully" not in result.message
+
+
 @pytest.mark.asyncio
 async def test_update_memory_failure(mock_memory_manager):
-    mock_memory_manager.update.side_effect = Exception("Update Failed")
+    mock_memory_manager.update.side_effect = MemoryBackendError("Update Failed")
     result = await updates.update_memory(mock_memory_manager, "id-1", "new text")
     assert "Error updating memory" in result.message
 
@@ -458,7 +693,9 @@ async def test_track_lifecycle_events_failure(mock_memory_manager):
 
 @pytest.mark.asyncio
 async def test_log_conceptual_roadmap_failure(mock_memory_manager):
-    mock_memory_manager.add_with_redaction.side_effect = Exception("Add error")
+    mock_memory_manager.add_with_redaction_segments.side_effect = MemoryBackendError(
+        "Add error"
+    )
 
     result = await roadmap.log_conceptual_roadmap(
         mock_memory_manager, "idea", "hyp", "block", "LOW"
@@ -467,9 +704,19 @@ async def test_log_conceptual_roadmap_failure(mock_memory_manager):
     assert "Failed to save Roadmap Entry: Add error" in result
 
 
+@pytest.mark.asyncio
+async def test_log_conceptual_roadmap_unexpected_error_propagates(mock_memory_manager):
+    mock_memory_manager.add_with_redaction_segments.side_effect = KeyError("bug")
+
+    with pytest.raises(KeyError):
+        await roadmap.log_conceptual_roadmap(
+            mock_memory_manager, "idea", "hyp", "block", "LOW"
+        )
+
+
 @pytest.mark.asyncio
 async def test_query_roadmap_failure(mock_memory_manager):
-    mock_memory_manager.search.side_effect = Exception("Search error")
+    mock_memory_manager.search.side_effect = MemoryBackendError("Search error")
 
     result = await roadmap.query_roadmap(mock_memory_manager, "pending", "HIGH")
 
@@ -478,7 +725,9 @@ async def test_query_roadmap_failure(mock_memory_manager):
 
 @pytest.mark.asyncio
 async def test_manage_trial_failure(mock_memory_manager):
-    mock_memory_manager.add_with_redaction.side_effect = Exception("Add error")
+    mock_memory_manager.add_with_redaction_segments.side_effect = MemoryBackendError(
+        "Add error"
+    )
 
     result = await trials.manage_trial(mock_memory_manager, "name", 1, "crit")
 
@@ -487,7 +736,7 @@ async def test_manage_trial_failure(mock_memory_manager):
 
 @pytest.mark.asyncio
 async def test_list_active_trials_failure(mock_memory_manager):
-    mock_memory_manager.search.side_effect = Exception("Search error")
+    mock_memory_manager.search.side_effect = MemoryBackendError("Search error")
 
     result = await trials.list_active_trials(mock_memory_manager, 1)
 
@@ -496,7 +745,9 @@ async def test_list_active_trials_failure(mock_memory_manager):
 
 @pytest.mark.asyncio
 async def test_log_troubleshooting_event_failure(mock_memory_manager):
-    mock_memory_manager.add_with_redaction.side_effect = Exception("Add error")
+    mock_memory_manager.add_with_redaction_segments.side_effect = MemoryBackendError(
+        "Add error"
+    )
 
     result = await troubleshooting.log_troubleshooting_event(
         mock_memory_manager, "err", "cause", "fix"
@@ -507,8 +758,22 @@ async def test_log_troubleshooting_event_failure(mock_memory_manager):
 
 @pytest.mark.asyncio
 async def test_get_troubleshooting_guide_failure(mock_memory_manager):
-    mock_memory_manager.search.side_effect = Exception("Search error")
+    mock_memory_manager.search.side_effect = MemoryBackendError("Search error")
 
     result = await troubleshooting.get_troubleshooting_guide(mock_memory_manager, "err")
 
     assert result == []
+
+
+# --- Error Boundary ---
+
+
+@pytest.mark.asyncio
+async def test_tool_error_boundary_formats_default_arguments():
+    @tool_error_boundary("Failed to list {kind} items")
+    async def list_items(memory: MemoryManager, kind: str = "active") -> str:
+        raise MemoryBackendError("Search error")
+
+    result = await list_items(MagicMock())
+
+    assert result == "Failed to list active items: Search error"
@@ -15,6 +15,7 @@ from dotfiles_maintainer.utils.vcs import (
     get_vcs_command,
     get_vcs_type_cached,
     is_in_repo,
+    split_log_entries,
     validate_vcs_installed,
 )
 
@@ -257,6 +258,18 @@ def test_vcs_get_current_commit_jj():
         mock_run.assert_called_with(["log", "-r", "@", "--no-graph", "-T", "commit_id"])
 
 
+def test_split_log_entries():
+    output = (
+        "a1b2c3d | 2026-01-02 10:00:00\n---------------\nfeat: zsh\n\n---------------\n\n"
+        "e4f5a6b | 2026-01-01 09:00:00\n---------------\nfix: nvim\n\n---------------\n\n"
+    )
+    assert split_log_entries(output) == [
+        "a1b2c3d | 2026-01-02 10:00:00\n---------------\nfeat: zsh",
+        "e4f5a6b | 2026-01-01 09:00:00\n---------------\nfix: nvim",
+    ]
+    assert split_log_entries("") == []
+
+
 # --- High Level Helpers ---
 
 